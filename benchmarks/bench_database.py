@@ -0,0 +1,81 @@
+"""
+Database per-call latency benchmark.
+
+Compares the old connect/commit/close-per-call pattern against the pooled
+connection used by core.database.Database.
+
+Usage:
+    python -m benchmarks.bench_database [iterations] [accounts]
+"""
+import sqlite3
+import sys
+import tempfile
+import time
+from pathlib import Path
+
+from core.database import Database
+
+
+def legacy_call(db_path, sql, params=(), commit=False):
+    """Run one statement the way Database used to: fresh connection per call"""
+    conn = sqlite3.connect(db_path)
+    cursor = conn.cursor()
+    cursor.execute(sql, params)
+    result = cursor.fetchall()
+    if commit:
+        conn.commit()
+    conn.close()
+    return result
+
+
+def legacy_operations(db_path, account_id):
+    return {
+        "get_all_accounts": lambda: legacy_call(
+            db_path, "SELECT id, name, session_dir, zoom_level, password_hash FROM accounts ORDER BY last_active DESC"),
+        "update_zoom_level": lambda: legacy_call(
+            db_path, "UPDATE accounts SET zoom_level = ? WHERE id = ?", (1.1, account_id), commit=True),
+        "has_password": lambda: legacy_call(
+            db_path, "SELECT password_hash FROM accounts WHERE id = ?", (account_id,)),
+        "update_last_active": lambda: legacy_call(
+            db_path, "UPDATE accounts SET last_active = CURRENT_TIMESTAMP WHERE id = ?", (account_id,), commit=True),
+    }
+
+
+def pooled_operations(db, account_id):
+    return {
+        "get_all_accounts": db.get_all_accounts,
+        "update_zoom_level": lambda: db.update_zoom_level(account_id, 1.1),
+        "has_password": lambda: db.has_password(account_id),
+        "update_last_active": lambda: db.update_last_active(account_id),
+    }
+
+
+def time_per_call(func, iterations):
+    start = time.perf_counter()
+    for _ in range(iterations):
+        func()
+    return (time.perf_counter() - start) / iterations * 1e6
+
+
+def run(iterations=500, accounts=20):
+    with tempfile.TemporaryDirectory() as tmp:
+        db = Database(Path(tmp))
+        account_ids = [db.add_account(f"Bench {i}")[0] for i in range(accounts)]
+        account_id = account_ids[0]
+        
+        legacy = legacy_operations(db.db_path, account_id)
+        pooled = pooled_operations(db, account_id)
+        
+        print(f"{'operation':<20} {'before (us)':>12} {'after (us)':>12} {'speedup':>8}")
+        for name in legacy:
+            before = time_per_call(legacy[name], iterations)
+            after = time_per_call(pooled[name], iterations)
+            print(f"{name:<20} {before:>12.1f} {after:>12.1f} {before / after:>7.1f}x")
+        
+        db.close()
+
+
+if __name__ == "__main__":
+    iterations = int(sys.argv[1]) if len(sys.argv) > 1 else 500
+    accounts = int(sys.argv[2]) if len(sys.argv) > 2 else 20
+    run(iterations, accounts)
@@ -0,0 +1,63 @@
+"""
+Account deletion latency benchmark.
+
+Measures how long the caller (the GUI thread) is blocked when an account
+with a populated session directory is removed: a synchronous rmtree, as
+Database.delete_account used to do, versus the rename-to-trash path.
+
+Usage:
+    python -m benchmarks.bench_delete [files] [file_kb]
+"""
+import os
+import shutil
+import sys
+import tempfile
+import time
+from pathlib import Path
+
+from core.database import Database
+
+
+def populate(session_dir, files, file_kb):
+    """Fill a session dir with a cache-like tree of small files"""
+    payload = os.urandom(file_kb * 1024)
+    for i in range(files):
+        folder = Path(session_dir) / "cache" / f"{i % 64:02x}"
+        folder.mkdir(parents=True, exist_ok=True)
+        (folder / f"f{i}").write_bytes(payload)
+
+
+def run(files=5000, file_kb=16):
+    with tempfile.TemporaryDirectory() as tmp:
+        db = Database(Path(tmp))
+
+        _, session_dir = db.add_account("Legacy")
+        populate(session_dir, files, file_kb)
+        start = time.perf_counter()
+        shutil.rmtree(session_dir)
+        before = (time.perf_counter() - start) * 1000
+
+        account_id, session_dir = db.add_account("Trash")
+        populate(session_dir, files, file_kb)
+        start = time.perf_counter()
+        db.delete_account(account_id)
+        after = (time.perf_counter() - start) * 1000
+
+        # Wait for the background purge so the numbers are comparable
+        start = time.perf_counter()
+        while any(db.trash.trash_dir.iterdir()):
+            time.sleep(0.01)
+        purge = (time.perf_counter() - start) * 1000
+
+        print(f"session dir: {files} files x {file_kb} KB")
+        print(f"{'blocking rmtree':<24} {before:>10.1f} ms")
+        print(f"{'delete_account (trash)':<24} {after:>10.1f} ms")
+        print(f"{'background purge':<24} {purge:>10.1f} ms")
+
+        db.close()
+
+
+if __name__ == "__main__":
+    files = int(sys.argv[1]) if len(sys.argv) > 1 else 5000
+    file_kb = int(sys.argv[2]) if len(sys.argv) > 2 else 16
+    run(files, file_kb)
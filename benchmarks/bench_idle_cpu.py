@@ -0,0 +1,131 @@
+"""
+Idle CPU of the whole process tree with every tab loaded.
+
+All tabs are built and loaded (WAM_LAZY_TABS=0), the app is left alone until
+the lifecycle controller has had time to act, then CPU time of the app and
+all Chromium children is measured over a fixed window. Runs once with the
+lifecycle controller disabled (hidden pages stay active) and once with it
+freezing hidden pages. Needs psutil.
+
+Usage:
+    python -m benchmarks.bench_idle_cpu [--url URL] [accounts] [seconds]
+"""
+import argparse
+import json
+import sys
+import time
+
+from benchmarks.harness import psutil, run_child, seed_accounts
+
+LOAD_TIMEOUT_SECONDS = 180
+SETTLE_SECONDS = 10
+
+
+def tree_cpu_seconds():
+    """User + system CPU time of this process and all of its children"""
+    process = psutil.Process()
+    total = 0.0
+    for proc in [process] + process.children(recursive=True):
+        try:
+            times = proc.cpu_times()
+            total += times.user + times.system
+        except psutil.Error:
+            pass
+    return total
+
+
+def child(accounts, seconds):
+    from main import create_application
+    from PyQt6.QtCore import QTimer
+    
+    seed_accounts(accounts)
+    
+    app = create_application(sys.argv)
+    from gui.main_window import MainWindow
+    
+    window = MainWindow()
+    window.show()
+    
+    deadline = time.perf_counter() + LOAD_TIMEOUT_SECONDS
+    
+    def loaded():
+        return [info["widget"] for info in window.tabs.values() if info["widget"].page_ready]
+    
+    result = {}
+    
+    def wait_for_loads():
+        if len(loaded()) == accounts:
+            poller.stop()
+            QTimer.singleShot(SETTLE_SECONDS * 1000, start_measuring)
+        elif time.perf_counter() > deadline:
+            # Measuring fewer tabs than asked for would understate idle CPU
+            poller.stop()
+            result["error"] = f"only {len(loaded())} of {accounts} tabs loaded within {LOAD_TIMEOUT_SECONDS}s"
+            app.quit()
+    
+    def start_measuring():
+        result["cpu_start"] = tree_cpu_seconds()
+        result["wall_start"] = time.perf_counter()
+        QTimer.singleShot(seconds * 1000, stop_measuring)
+    
+    def stop_measuring():
+        result["cpu"] = tree_cpu_seconds() - result["cpu_start"]
+        result["wall"] = time.perf_counter() - result["wall_start"]
+        app.quit()
+    
+    poller = QTimer()
+    poller.timeout.connect(wait_for_loads)
+    poller.start(250)
+    app.exec()
+    
+    if "error" in result:
+        window.close()
+        sys.exit(result["error"])
+    
+    states = [info["widget"].lifecycle_state for info in window.tabs.values()]
+    window.close()
+    print(json.dumps({
+        "loaded": len(loaded()),
+        "frozen": sum(1 for state in states if state != "active"),
+        "cpu_percent": result["cpu"] / result["wall"] * 100,
+    }))
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Idle CPU with all tabs loaded")
+    parser.add_argument("accounts", nargs="?", type=int, default=15)
+    parser.add_argument("seconds", nargs="?", type=int, default=30)
+    parser.add_argument("--url", help="target URL instead of the local stand-in")
+    args = parser.parse_args()
+    
+    if psutil is None:
+        print("psutil is required for this benchmark")
+        return
+    
+    server = None
+    url = args.url
+    if not url:
+        from benchmarks.fake_whatsapp import serve
+        server, url = serve()
+    
+    env = {"WAM_TARGET_URL": url, "WAM_LAZY_TABS": "0", "WAM_PREWARM_TABS": "0", "WAM_LIFECYCLE_CHECK_SECONDS": "1"}
+    modes = (
+        ("all active", {"WAM_FREEZE_AFTER_SECONDS": "0"}),
+        ("frozen", {"WAM_FREEZE_AFTER_SECONDS": "2"}),
+    )
+    print(f"Target: {url}, {args.accounts} accounts, {args.seconds}s window")
+    print(f"{'mode':<12} {'loaded':>6} {'frozen':>6} {'CPU %':>8}")
+    try:
+        for name, mode_env in modes:
+            r = run_child("benchmarks.bench_idle_cpu", [args.accounts, args.seconds], dict(env, **mode_env))
+            print(f"{name:<12} {r['loaded']:>6} {r['frozen']:>6} {r['cpu_percent']:>8.1f}")
+    finally:
+        if server:
+            server.shutdown()
+
+
+if __name__ == "__main__":
+    if len(sys.argv) > 3 and sys.argv[1] == "--child":
+        child(int(sys.argv[2]), int(sys.argv[3]))
+    else:
+        main()
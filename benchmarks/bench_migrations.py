@@ -0,0 +1,65 @@
+"""
+Schema check cost at startup.
+
+Compares the old init_db (CREATE TABLE IF NOT EXISTS plus a SELECT probe
+per column, caught OperationalError for missing ones) with the versioned
+migration runner on an up to date database, and times a full migration of
+a fresh database.
+
+Usage:
+    python -m benchmarks.bench_migrations [iterations]
+"""
+import sqlite3
+import sys
+import tempfile
+import time
+from pathlib import Path
+
+from core import migrations
+
+
+def legacy_init(conn):
+    """init_db as it was before user_version migrations"""
+    cursor = conn.cursor()
+    cursor.execute("""
+        CREATE TABLE IF NOT EXISTS accounts (
+            id INTEGER PRIMARY KEY AUTOINCREMENT,
+            name TEXT NOT NULL,
+            session_dir TEXT NOT NULL,
+            last_active TIMESTAMP DEFAULT CURRENT_TIMESTAMP,
+            settings TEXT
+        )
+    """)
+    for column, declaration in (("zoom_level", "REAL DEFAULT 1.0"), ("password_hash", "TEXT")):
+        try:
+            cursor.execute(f"SELECT {column} FROM accounts LIMIT 1")
+        except sqlite3.OperationalError:
+            cursor.execute(f"ALTER TABLE accounts ADD COLUMN {column} {declaration}")
+    conn.commit()
+
+
+def time_per_call(func, iterations):
+    start = time.perf_counter()
+    for _ in range(iterations):
+        func()
+    return (time.perf_counter() - start) / iterations * 1e6
+
+
+def run(iterations=1000):
+    with tempfile.TemporaryDirectory() as tmp:
+        conn = sqlite3.connect(Path(tmp) / "accounts.db")
+        start = time.perf_counter()
+        migrations.migrate(conn)
+        full = (time.perf_counter() - start) * 1e6
+        
+        before = time_per_call(lambda: legacy_init(conn), iterations)
+        after = time_per_call(lambda: migrations.migrate(conn), iterations)
+        conn.close()
+    
+    print(f"{'fresh database, all migrations':<34} {full:>10.1f} us")
+    print(f"{'up to date, try/except probes':<34} {before:>10.1f} us")
+    print(f"{'up to date, user_version check':<34} {after:>10.1f} us")
+
+
+if __name__ == "__main__":
+    run(int(sys.argv[1]) if len(sys.argv) > 1 else 1000)
@@ -0,0 +1,51 @@
+"""
+Password verification latency.
+
+Compares the legacy unsalted SHA256 check with the salted KDF hashes
+(scrypt, and PBKDF2 where scrypt is unavailable), and shows how long the
+caller is blocked when verification is handed to the password worker
+instead of running inline on the GUI thread.
+
+Usage:
+    python -m benchmarks.bench_passwords [iterations]
+"""
+import hashlib
+import sys
+import threading
+import time
+
+from core import passwords
+
+
+def time_per_call(func, iterations):
+    start = time.perf_counter()
+    for _ in range(iterations):
+        func()
+    return (time.perf_counter() - start) / iterations * 1000
+
+
+def run(iterations=20):
+    password = "correct horse battery staple"
+    legacy = hashlib.sha256(password.encode()).hexdigest()
+    current = passwords.hash_password(password)
+    
+    print(f"{'scheme':<16} {'verify (ms)':>12}")
+    print(f"{'sha256 (legacy)':<16} {time_per_call(lambda: passwords.verify_password(password, legacy), iterations):>12.3f}")
+    print(f"{current.split('$')[0]:<16} {time_per_call(lambda: passwords.verify_password(password, current), iterations):>12.3f}")
+    
+    # Caller-side cost with the worker: submit returns immediately
+    done = threading.Event()
+    worker = passwords.PasswordWorker(lambda callback, result: callback(result))
+    blocked = []
+    for _ in range(iterations):
+        done.clear()
+        start = time.perf_counter()
+        worker.submit(lambda: passwords.verify_password(password, current), lambda ok: done.set())
+        blocked.append((time.perf_counter() - start) * 1000)
+        done.wait()
+    worker.stop()
+    print(f"{'caller blocked':<16} {sum(blocked) / len(blocked):>12.3f}  (worker thread)")
+
+
+if __name__ == "__main__":
+    run(int(sys.argv[1]) if len(sys.argv) > 1 else 20)
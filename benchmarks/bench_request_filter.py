@@ -0,0 +1,76 @@
+"""
+Request filter lookup cost.
+
+Matches a stream of request URLs against N domain/path rules two ways: a
+linear list of compiled regexes (one per rule) and the RuleMatcher domain
+trie used by the request interceptor. Interception runs for every request
+of every account, so this is paid per request.
+
+Usage:
+    python -m benchmarks.bench_request_filter [requests]
+"""
+import random
+import re
+import sys
+import time
+
+from core.request_rules import DEFAULT_RULES, Rule, RuleMatcher
+
+CATEGORIES = frozenset({"telemetry", "prefetch", "background_media"})
+
+
+def make_rules(count):
+    """The default rules plus count synthetic tracker domains"""
+    rules = list(DEFAULT_RULES)
+    for i in range(count):
+        rules.append(Rule("telemetry", "block", domain=f"tracker{i}.example{i % 7}.com", path="/collect" if i % 2 else ""))
+    return rules
+
+
+def make_requests(count):
+    rng = random.Random(1)
+    hosts = ["web.whatsapp.com", "static.whatsapp.net", "mmg.whatsapp.net", "pps.whatsapp.net",
+             "dit.whatsapp.net", "tracker3.example3.com", "cdn.example.org"]
+    types = ["xhr", "script", "image", "media", "ping", "prefetch"]
+    return [(rng.choice(hosts), f"/path/{rng.randrange(1000)}", rng.choice(types)) for _ in range(count)]
+
+
+def regex_matcher(rules):
+    """One regex per rule, tried in order (the obvious alternative)"""
+    compiled = []
+    for rule in rules:
+        domain = r"(?:[^/]*\.)?" + re.escape(rule.domain) if rule.domain else r"[^/]*"
+        compiled.append((re.compile(f"^{domain}{re.escape(rule.path)}"), rule))
+    
+    def match(host, path, resource_type, categories):
+        url = host + path
+        for pattern, rule in compiled:
+            if rule.category not in categories:
+                continue
+            if rule.resource_types and resource_type not in rule.resource_types:
+                continue
+            if pattern.match(url):
+                return rule
+        return None
+    return match
+
+
+def time_per_request(match, requests):
+    start = time.perf_counter()
+    for host, path, resource_type in requests:
+        match(host, path, resource_type, CATEGORIES)
+    return (time.perf_counter() - start) / len(requests) * 1e6
+
+
+def run(request_count=20000):
+    requests = make_requests(request_count)
+    print(f"{'rules':>6} {'regex list (us)':>16} {'trie (us)':>10}")
+    for count in (10, 100, 1000, 5000):
+        rules = make_rules(count)
+        linear = time_per_request(regex_matcher(rules), requests)
+        trie = time_per_request(RuleMatcher(rules).match, requests)
+        print(f"{len(rules):>6} {linear:>16.2f} {trie:>10.2f}")
+
+
+if __name__ == "__main__":
+    run(int(sys.argv[1]) if len(sys.argv) > 1 else 20000)
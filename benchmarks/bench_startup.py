@@ -0,0 +1,73 @@
+"""
+Startup time and peak memory with N saved accounts, eager vs lazy tabs.
+
+Each measurement runs in a fresh child process (offscreen, throw-away data
+directory) so WebEngine state never leaks between runs. Peak RSS covers the
+app process plus every Chromium child it spawned and needs psutil.
+
+Usage:
+    python -m benchmarks.bench_startup [accounts ...]
+"""
+import json
+import sys
+import time
+
+from benchmarks.harness import psutil, tree_rss, run_child, seed_accounts
+
+SETTLE_SECONDS = 10
+SAMPLE_INTERVAL_MS = 250
+
+
+def child(accounts):
+    """Seed the data dir, build MainWindow and report timings as JSON"""
+    start = time.perf_counter()
+    
+    from main import create_application
+    from PyQt6.QtCore import QTimer
+    
+    seed_accounts(accounts)
+    
+    app = create_application(sys.argv)
+    from gui.main_window import MainWindow
+    
+    window_start = time.perf_counter()
+    window = MainWindow()
+    window.show()
+    app.processEvents()
+    window_ready = time.perf_counter()
+    
+    peak = [tree_rss()]
+    sampler = QTimer()
+    sampler.timeout.connect(lambda: peak.__setitem__(0, max(peak[0], tree_rss())))
+    sampler.start(SAMPLE_INTERVAL_MS)
+    QTimer.singleShot(SETTLE_SECONDS * 1000, app.quit)
+    app.exec()
+    
+    window.close()
+    print(json.dumps({
+        "startup_s": window_ready - start,
+        "window_s": window_ready - window_start,
+        "peak_rss_mb": peak[0] / (1024 * 1024),
+    }))
+
+
+def measure(accounts, lazy):
+    return run_child("benchmarks.bench_startup", [accounts], {"WAM_LAZY_TABS": "1" if lazy else "0"})
+
+
+def run(account_counts):
+    if psutil is None:
+        print("psutil not installed: peak RSS will be reported as 0")
+    print(f"{'accounts':>8} {'mode':>6} {'startup (s)':>12} {'window (s)':>11} {'peak RSS (MB)':>14}")
+    for accounts in account_counts:
+        for lazy in (False, True):
+            r = measure(accounts, lazy)
+            mode = "lazy" if lazy else "eager"
+            print(f"{accounts:>8} {mode:>6} {r['startup_s']:>12.2f} {r['window_s']:>11.2f} {r['peak_rss_mb']:>14.0f}")
+
+
+if __name__ == "__main__":
+    if len(sys.argv) > 2 and sys.argv[1] == "--child":
+        child(int(sys.argv[2]))
+    else:
+        run([int(n) for n in sys.argv[1:]] or [1, 5, 15])
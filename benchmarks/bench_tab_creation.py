@@ -0,0 +1,87 @@
+"""
+Tab creation latency: the old per-creation profile rebuild versus the
+shared settings template and per-account profile reuse of gui.profile_factory.
+
+Measures web view construction only (no page load), offscreen.
+
+Usage:
+    python -m benchmarks.bench_tab_creation [tabs]
+"""
+import gc
+import os
+import sys
+import tempfile
+import time
+
+os.environ.setdefault("QT_QPA_PLATFORM", "offscreen")
+
+from PyQt6.QtWidgets import QApplication, QWidget
+from PyQt6.QtCore import QCoreApplication
+from PyQt6.QtWebEngineWidgets import QWebEngineView
+from PyQt6.QtWebEngineCore import QWebEngineProfile, QWebEnginePage
+
+from gui import profile_factory
+
+
+def legacy_create(session_dir, index, parent):
+    """What create_webview used to do on every creation"""
+    gc.collect()
+    profile = QWebEngineProfile(f"legacy_{index}_{int(time.time() * 1000)}", None)
+    profile.setPersistentStoragePath(session_dir)
+    profile.setCachePath(os.path.join(session_dir, "cache"))
+    profile.setHttpCacheMaximumSize(profile_factory.HTTP_CACHE_SIZE)
+    profile.setHttpUserAgent(profile_factory.USER_AGENT)
+    settings = profile.settings()
+    for attribute, value in profile_factory.SETTINGS_TEMPLATE:
+        settings.setAttribute(attribute, value)
+    page = QWebEnginePage(profile, parent)
+    view = QWebEngineView(parent)
+    view.setPage(page)
+    QCoreApplication.processEvents()
+    return view
+
+
+def factory_create(factory, session_dir, index, parent):
+    profile = factory.profile_for(index, session_dir)
+    page = QWebEnginePage(profile, parent)
+    view = QWebEngineView(parent)
+    view.setPage(page)
+    return view
+
+
+def timed(func, count):
+    samples = []
+    for i in range(count):
+        start = time.perf_counter()
+        func(i)
+        samples.append((time.perf_counter() - start) * 1000)
+    samples.sort()
+    return sum(samples) / len(samples), samples[len(samples) // 2]
+
+
+def run(count=20):
+    app = QApplication(sys.argv)
+    parent = QWidget()
+    with tempfile.TemporaryDirectory() as tmp:
+        dirs = []
+        for i in range(count):
+            path = os.path.join(tmp, f"session_{i}")
+            os.makedirs(path)
+            dirs.append(path)
+        
+        factory = profile_factory.ProfileFactory()
+        results = {
+            "legacy (rebuild + gc)": timed(lambda i: legacy_create(dirs[i], i, parent), count),
+            "factory, new profile": timed(lambda i: factory_create(factory, dirs[i], i, parent), count),
+            # Same accounts again: what hibernate/restore pays now
+            "factory, reused profile": timed(lambda i: factory_create(factory, dirs[i], i, parent), count),
+        }
+        
+        print(f"{'variant':<26} {'mean (ms)':>10} {'median (ms)':>12}")
+        for name, (mean, median) in results.items():
+            print(f"{name:<26} {mean:>10.2f} {median:>12.2f}")
+    app.quit()
+
+
+if __name__ == "__main__":
+    run(int(sys.argv[1]) if len(sys.argv) > 1 else 20)
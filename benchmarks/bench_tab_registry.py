@@ -0,0 +1,121 @@
+"""
+Tab bookkeeping cost as the number of accounts grows.
+
+Replays the main window's tab handling on a bare QTabWidget (plain
+QWidgets, no WebEngine) two ways: the old dict of
+{"name", "widget", "index"} with linear scans and update_tab_indices()
+after every change, and gui.tab_registry.TabRegistry. Reports microseconds
+per tab for loading the strip, per drag-move (followed by a title refresh)
+and per close.
+
+Usage:
+    python -m benchmarks.bench_tab_registry [accounts ...]
+"""
+import os
+import sys
+import time
+
+os.environ.setdefault("QT_QPA_PLATFORM", "offscreen")
+
+from PyQt6.QtWidgets import QApplication, QTabWidget, QWidget
+
+from gui.tab_registry import TabRegistry
+
+DEFAULT_ACCOUNTS = (10, 50, 100, 200, 400)
+
+
+class LegacyTabs:
+    """Tab bookkeeping as MainWindow did it before TabRegistry"""
+    
+    def __init__(self, tab_widget):
+        self.tab_widget = tab_widget
+        self.tabs = {}
+    
+    def update_tab_indices(self):
+        for info in self.tabs.values():
+            current_index = self.tab_widget.indexOf(info["widget"])
+            if current_index >= 0 and current_index != info["index"]:
+                info["index"] = current_index
+    
+    def add(self, account_id, widget):
+        index = self.tab_widget.addTab(widget, str(account_id))
+        self.tabs[account_id] = {"name": str(account_id), "widget": widget, "index": index}
+        self.update_tab_indices()
+    
+    def moved(self, account_id):
+        self.update_tab_indices()
+        index = self.tab_widget.indexOf(self.tabs[account_id]["widget"])
+        self.tab_widget.setTabText(index, str(account_id))
+    
+    def close(self, index):
+        widget = self.tab_widget.widget(index)
+        account_id = None
+        for aid, info in self.tabs.items():
+            if info["widget"] == widget:
+                account_id = aid
+                break
+        del self.tabs[account_id]
+        self.tab_widget.removeTab(index)
+        self.update_tab_indices()
+
+
+class RegistryTabs:
+    """The same operations through TabRegistry"""
+    
+    def __init__(self, tab_widget):
+        self.tab_widget = tab_widget
+        self.tabs = TabRegistry(tab_widget)
+    
+    def add(self, account_id, widget):
+        self.tab_widget.addTab(widget, str(account_id))
+        self.tabs.add(account_id, str(account_id), widget)
+    
+    def moved(self, account_id):
+        self.tabs.moved(0, self.tab_widget.count() - 1)
+        self.tab_widget.setTabText(self.tabs.index_of(account_id), str(account_id))
+    
+    def close(self, index):
+        account_id = self.tabs.account_at(index)
+        self.tabs.remove(account_id)
+        self.tab_widget.removeTab(index)
+
+
+def measure(kind, accounts):
+    tab_widget = QTabWidget()
+    tabs = kind(tab_widget)
+    widgets = [QWidget() for _ in range(accounts)]
+    
+    start = time.perf_counter()
+    for account_id, widget in enumerate(widgets):
+        tabs.add(account_id, widget)
+    load = time.perf_counter() - start
+    
+    moves = min(accounts, 50)
+    bar = tab_widget.tabBar()
+    start = time.perf_counter()
+    for i in range(moves):
+        bar.moveTab(0, accounts - 1)
+        tabs.moved(i)
+    move = time.perf_counter() - start
+    
+    start = time.perf_counter()
+    while tab_widget.count():
+        tabs.close(tab_widget.count() // 2)
+    close = time.perf_counter() - start
+    
+    tab_widget.deleteLater()
+    return load / accounts * 1e6, move / moves * 1e6, close / accounts * 1e6
+
+
+def run(account_counts):
+    app = QApplication.instance() or QApplication(sys.argv)
+    print(f"{'accounts':>8} {'':>9} {'load/tab us':>12} {'move us':>10} {'close/tab us':>13}")
+    for accounts in account_counts:
+        for name, kind in (("before", LegacyTabs), ("registry", RegistryTabs)):
+            load, move, close = measure(kind, accounts)
+            print(f"{accounts:>8} {name:>9} {load:>12.1f} {move:>10.1f} {close:>13.1f}")
+    app.processEvents()
+
+
+if __name__ == "__main__":
+    run([int(n) for n in sys.argv[1:]] or list(DEFAULT_ACCOUNTS))
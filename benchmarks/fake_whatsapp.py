@@ -0,0 +1,117 @@
+"""
+Local stand-in for WhatsApp Web: a synthetic, deliberately heavy single page
+app served over HTTP so load and memory benchmarks are reproducible offline.
+
+The page pulls a multi-megabyte script bundle, builds a large DOM (chat list
+and message pane), keeps a few tens of MB of JS objects alive and updates the
+title like WhatsApp does ("(3) WhatsApp").
+
+Usage:
+    python -m benchmarks.fake_whatsapp [port]
+"""
+import sys
+import threading
+from http.server import ThreadingHTTPServer, BaseHTTPRequestHandler
+
+BUNDLE_FUNCTIONS = 20000
+CHATS = 300
+MESSAGES = 2000
+RETAINED_MB = 32
+
+INDEX_HTML = f"""<!DOCTYPE html>
+<html>
+<head>
+<meta charset="utf-8">
+<title>WhatsApp</title>
+<link rel="stylesheet" href="/app.css">
+</head>
+<body>
+<div id="app"><div id="chats"></div><div id="messages"></div></div>
+<script src="/app.js"></script>
+<script>
+  boot({CHATS}, {MESSAGES}, {RETAINED_MB});
+</script>
+</body>
+</html>
+"""
+
+APP_CSS = "\n".join(
+    f".c{i} {{ color: #{i % 0xffffff:06x}; padding: {i % 7}px; }}" for i in range(5000)
+)
+
+
+def build_bundle():
+    parts = [f"function f{i}(x) {{ return (x * {i + 1}) % 9973 + '{'x' * 40}'.length; }}"
+             for i in range(BUNDLE_FUNCTIONS)]
+    parts.append("""
+var retained = [];
+function boot(chats, messages, retainedMb) {
+  var chatPane = document.getElementById('chats');
+  for (var i = 0; i < chats; i++) {
+    var row = document.createElement('div');
+    row.className = 'c' + i;
+    row.textContent = 'Chat ' + i + ' ' + f""" + str(BUNDLE_FUNCTIONS - 1) + """(i);
+    chatPane.appendChild(row);
+  }
+  var messagePane = document.getElementById('messages');
+  for (var j = 0; j < messages; j++) {
+    var msg = document.createElement('p');
+    msg.textContent = 'Message ' + j + ' lorem ipsum dolor sit amet';
+    messagePane.appendChild(msg);
+  }
+  for (var k = 0; k < retainedMb; k++) {
+    retained.push(new Array(128 * 1024).fill(k));
+  }
+  var unread = 0;
+  setInterval(function () {
+    unread = (unread + 1) % 5;
+    document.title = unread ? '(' + unread + ') WhatsApp' : 'WhatsApp';
+  }, 5000);
+}
+""")
+    return "\n".join(parts)
+
+
+APP_JS = build_bundle()
+
+ROUTES = {
+    "/": ("text/html; charset=utf-8", INDEX_HTML),
+    "/app.js": ("application/javascript", APP_JS),
+    "/app.css": ("text/css", APP_CSS),
+}
+
+
+class Handler(BaseHTTPRequestHandler):
+    def do_GET(self):
+        route = ROUTES.get(self.path.split("?")[0])
+        if route is None:
+            self.send_error(404)
+            return
+        content_type, body = route
+        data = body.encode("utf-8")
+        self.send_response(200)
+        self.send_header("Content-Type", content_type)
+        self.send_header("Content-Length", str(len(data)))
+        self.send_header("Cache-Control", "max-age=3600")
+        self.end_headers()
+        self.wfile.write(data)
+    
+    def log_message(self, format, *args):
+        pass
+
+
+def serve(port=0):
+    """Start the server in a daemon thread; returns (server, url)"""
+    server = ThreadingHTTPServer(("127.0.0.1", port), Handler)
+    thread = threading.Thread(target=server.serve_forever, daemon=True)
+    thread.start()
+    return server, f"http://127.0.0.1:{server.server_address[1]}/"
+
+
+if __name__ == "__main__":
+    server, url = serve(int(sys.argv[1]) if len(sys.argv) > 1 else 8765)
+    print(f"Serving fake WhatsApp Web at {url} (Ctrl+C to stop)")
+    try:
+        threading.Event().wait()
+    except KeyboardInterrupt:
+        server.shutdown()
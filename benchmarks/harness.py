@@ -0,0 +1,52 @@
+"""Shared helpers for benchmarks that run the app in a child process."""
+import json
+import os
+import subprocess
+import sys
+import tempfile
+
+try:
+    import psutil
+except ImportError:
+    psutil = None
+
+
+def tree_rss():
+    """RSS of this process and all of its children, in bytes (0 without psutil)"""
+    if psutil is None:
+        return 0
+    process = psutil.Process()
+    total = 0
+    for proc in [process] + process.children(recursive=True):
+        try:
+            total += proc.memory_info().rss
+        except psutil.Error:
+            pass
+    return total
+
+
+def run_child(module, args, env=None):
+    """Run `python -m module --child args...` offscreen with a throw-away data
+    dir and return the JSON object it prints on its last line"""
+    with tempfile.TemporaryDirectory() as data_dir:
+        child_env = dict(os.environ)
+        child_env.setdefault("QT_QPA_PLATFORM", "offscreen")
+        child_env["WAM_DATA_DIR"] = data_dir
+        child_env.update(env or {})
+        result = subprocess.run(
+            [sys.executable, "-m", module, "--child"] + [str(arg) for arg in args],
+            env=child_env, capture_output=True, text=True
+        )
+        lines = result.stdout.strip().splitlines()
+        if result.returncode != 0 or not lines:
+            raise RuntimeError(f"{module} child failed:\n{result.stderr}")
+        return json.loads(lines[-1])
+
+
+def seed_accounts(count):
+    """Create `count` accounts in the (WAM_DATA_DIR) database"""
+    from core.database import Database
+    db = Database()
+    for i in range(count):
+        db.add_account(f"Bench {i}")
+    db.close()
@@ -0,0 +1,146 @@
+"""
+Headless benchmark suite.
+
+Runs MainWindow offscreen (QT_QPA_PLATFORM=offscreen) against the local
+WhatsApp Web stand-in in benchmarks/fake_whatsapp.py and reports, per account
+count: startup time, per-tab time-to-load (mean/max of time-to-interactive),
+peak RSS of the whole process tree and database operation latency.
+
+Usage:
+    python -m benchmarks.run_benchmarks [--lazy] [--url URL] [--json FILE] [accounts ...]
+
+Account counts default to 1 5 15 30. Without --lazy every tab is built at
+startup (WAM_LAZY_TABS=0) so all of them go through the load scheduler.
+"""
+import argparse
+import json
+import sys
+import time
+
+from benchmarks.harness import psutil, tree_rss, run_child, seed_accounts
+
+DEFAULT_ACCOUNTS = (1, 5, 15, 30)
+LOAD_TIMEOUT_SECONDS = 180
+SAMPLE_INTERVAL_MS = 250
+DB_ITERATIONS = 200
+
+
+def db_latency(db):
+    """Mean microseconds per call of common Database operations"""
+    account_id = db.get_all_accounts()[0][0]
+    operations = {
+        "get_all_accounts": db.get_all_accounts,
+        "has_password": lambda: db.has_password(account_id),
+        "update_zoom_level": lambda: db.update_zoom_level(account_id, 1.0),
+        "update_account_name": lambda: db.update_account_name(account_id, "Bench 0"),
+    }
+    result = {}
+    for name, func in operations.items():
+        start = time.perf_counter()
+        for _ in range(DB_ITERATIONS):
+            func()
+        result[name] = (time.perf_counter() - start) / DB_ITERATIONS * 1e6
+    return result
+
+
+def child(accounts):
+    start = time.perf_counter()
+    
+    from main import create_application
+    from PyQt6.QtCore import QTimer
+    
+    seed_accounts(accounts)
+    
+    app = create_application(sys.argv)
+    from gui.main_window import MainWindow
+    
+    window = MainWindow()
+    window.show()
+    app.processEvents()
+    startup = time.perf_counter() - start
+    
+    # Tabs expected to load: all of them, or only the built ones in lazy mode
+    peak = [tree_rss()]
+    deadline = time.perf_counter() + LOAD_TIMEOUT_SECONDS
+    
+    def expected():
+        return [info["widget"] for info in window.tabs.values() if info["widget"].web_view]
+    
+    def poll():
+        peak[0] = max(peak[0], tree_rss())
+        tabs = expected()
+        loaded = [tab for tab in tabs if window.telemetry.tab(tab.account_id).time_to_interactive is not None]
+        if (tabs and len(loaded) == len(tabs)) or time.perf_counter() > deadline:
+            app.quit()
+    
+    poller = QTimer()
+    poller.timeout.connect(poll)
+    poller.start(SAMPLE_INTERVAL_MS)
+    app.exec()
+    all_loaded = time.perf_counter() - start
+    
+    ttis = [m.time_to_interactive for m in window.telemetry.tabs.values() if m.time_to_interactive is not None]
+    loads = [m.last_load_seconds for m in window.telemetry.tabs.values() if m.last_load_seconds is not None]
+    result = {
+        "accounts": accounts,
+        "startup_s": startup,
+        "all_loaded_s": all_loaded,
+        "tabs_loaded": len(ttis),
+        "tti_mean_s": sum(ttis) / len(ttis) if ttis else None,
+        "tti_max_s": max(ttis) if ttis else None,
+        "load_mean_s": sum(loads) / len(loads) if loads else None,
+        "peak_rss_mb": peak[0] / (1024 * 1024),
+        "db_us": db_latency(window.db),
+    }
+    window.close()
+    print(json.dumps(result))
+
+
+def fmt(value, digits=2):
+    return "-" if value is None else f"{value:.{digits}f}"
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Headless WhatsApp Manager benchmarks")
+    parser.add_argument("accounts", nargs="*", type=int, default=list(DEFAULT_ACCOUNTS))
+    parser.add_argument("--lazy", action="store_true", help="keep lazy tabs (only active/prewarmed tabs load)")
+    parser.add_argument("--url", help="target URL instead of the local stand-in")
+    parser.add_argument("--json", help="also write the results to this file")
+    args = parser.parse_args()
+    
+    server = None
+    url = args.url
+    if not url:
+        from benchmarks.fake_whatsapp import serve
+        server, url = serve()
+    
+    if psutil is None:
+        print("psutil not installed: peak RSS will be reported as 0")
+    
+    env = {"WAM_TARGET_URL": url, "WAM_LAZY_TABS": "1" if args.lazy else "0"}
+    results = []
+    print(f"Target: {url}")
+    print(f"{'accounts':>8} {'startup':>8} {'all loaded':>10} {'loaded':>6} {'TTI mean':>9} "
+          f"{'TTI max':>8} {'peak RSS MB':>11} {'db get/upd us':>14}")
+    try:
+        for accounts in args.accounts:
+            r = run_child("benchmarks.run_benchmarks", [accounts], env)
+            results.append(r)
+            db = r["db_us"]
+            print(f"{accounts:>8} {fmt(r['startup_s']):>8} {fmt(r['all_loaded_s']):>10} {r['tabs_loaded']:>6} "
+                  f"{fmt(r['tti_mean_s']):>9} {fmt(r['tti_max_s']):>8} {r['peak_rss_mb']:>11.0f} "
+                  f"{db['get_all_accounts']:>6.1f}/{db['update_zoom_level']:<6.1f}")
+    finally:
+        if server:
+            server.shutdown()
+    
+    if args.json:
+        with open(args.json, "w", encoding="utf-8") as f:
+            json.dump(results, f, indent=2)
+
+
+if __name__ == "__main__":
+    if len(sys.argv) > 2 and sys.argv[1] == "--child":
+        child(int(sys.argv[2]))
+    else:
+        main()
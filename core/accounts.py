@@ -0,0 +1,61 @@
+import threading
+from dataclasses import dataclass, field
+from typing import Optional
+
+@dataclass
+class Account:
+    """In-memory copy of one row of the accounts table"""
+    id: int
+    name: str
+    session_dir: str
+    zoom_level: float = 1.0
+    password_hash: Optional[str] = None
+    last_active: Optional[str] = None
+    settings: dict = field(default_factory=dict)  # per-account options (accounts.settings JSON)
+    
+    def as_row(self):
+        """Row shape returned by Database.get_all_accounts()"""
+        return (self.id, self.name, self.session_dir, self.zoom_level, self.password_hash)
+
+class AccountRegistry:
+    """Account metadata cache, loaded once and kept coherent by Database mutators"""
+    
+    def __init__(self):
+        self._accounts = {}
+        self._lock = threading.Lock()
+    
+    def load(self, accounts):
+        with self._lock:
+            self._accounts = {account.id: account for account in accounts}
+    
+    def get(self, account_id):
+        return self._accounts.get(account_id)
+    
+    def add(self, account):
+        with self._lock:
+            self._accounts[account.id] = account
+    
+    def remove(self, account_id):
+        with self._lock:
+            return self._accounts.pop(account_id, None)
+    
+    def update(self, account_id, **fields):
+        """Update cached fields of an account (ignored for unknown ids)"""
+        with self._lock:
+            account = self._accounts.get(account_id)
+            if account is None:
+                return
+            for key, value in fields.items():
+                setattr(account, key, value)
+    
+    def ordered(self):
+        """Accounts sorted like the old ORDER BY last_active DESC query"""
+        with self._lock:
+            accounts = list(self._accounts.values())
+        return sorted(accounts, key=lambda a: a.last_active or "", reverse=True)
+    
+    def __contains__(self, account_id):
+        return account_id in self._accounts
+    
+    def __len__(self):
+        return len(self._accounts)
@@ -0,0 +1,31 @@
+import math
+
+# Recency counts half after this many hours without use
+RECENCY_HALF_LIFE_HOURS = 72
+
+# Weight of recency vs. share of foreground time in the score
+RECENCY_WEIGHT = 0.6
+
+def cache_score(idle_seconds, foreground_share):
+    """Score in [0, 1]: 1 for an account in use right now that gets the most screen time"""
+    if math.isinf(idle_seconds):
+        recency = 0.0
+    else:
+        recency = 0.5 ** (idle_seconds / (RECENCY_HALF_LIFE_HOURS * 3600))
+    return RECENCY_WEIGHT * recency + (1 - RECENCY_WEIGHT) * min(1.0, foreground_share)
+
+def cache_sizes(activity, min_bytes, max_bytes):
+    """HTTP cache limit per account from (account_id, idle_seconds, foreground_seconds) tuples.
+    
+    Foreground time is taken relative to the most used account, so the
+    primary account always scores full marks on that half.
+    """
+    activity = list(activity)
+    busiest = max((foreground for _, _, foreground in activity), default=0)
+    sizes = {}
+    for account_id, idle, foreground in activity:
+        share = foreground / busiest if busiest else 0.0
+        size = min_bytes + (max_bytes - min_bytes) * cache_score(idle, share)
+        # Whole MB, so small shifts in activity don't resize every time
+        sizes[account_id] = int(size // (1024 * 1024)) * 1024 * 1024
+    return sizes
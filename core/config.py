@@ -0,0 +1,115 @@
+import os
+import sys
+from pathlib import Path
+
+# Application-wide tunables. Each one can be overridden with a WAM_* environment
+# variable, which is how the benchmarks switch behaviour without code changes.
+
+def _env_str(name, default):
+    return os.environ.get(name) or default
+
+def _env_int(name, default):
+    try:
+        return int(os.environ[name])
+    except (KeyError, ValueError):
+        return default
+
+def _env_bool(name, default):
+    value = os.environ.get(name)
+    if value is None:
+        return default
+    return value.strip().lower() in ("1", "true", "yes", "on")
+
+# Where accounts.db and the per-account session directories live
+DATA_DIR = Path(_env_str("WAM_DATA_DIR", str(Path.home() / ".whatsapp-manager")))
+
+# Bundle of scripts injected into every page (manifest.json + .js files);
+# PyInstaller unpacks it next to the code under sys._MEIPASS
+USER_SCRIPTS_DIR = Path(_env_str("WAM_USER_SCRIPTS_DIR", str(
+    Path(getattr(sys, "_MEIPASS", Path(__file__).resolve().parent.parent)) / "userscripts")))
+
+# Page loaded in every account tab (benchmarks point this at a local stand-in)
+WHATSAPP_URL = _env_str("WAM_TARGET_URL", "https://web.whatsapp.com")
+
+# Request filter categories enabled for accounts that have not chosen their
+# own ("telemetry", "prefetch", "background_media"; "none" for no filtering)
+REQUEST_FILTER = _env_str("WAM_REQUEST_FILTER", "telemetry,prefetch")
+
+# Build the WebEngine view of a tab only when it is first shown
+LAZY_TABS = _env_bool("WAM_LAZY_TABS", True)
+
+# Accounts predicted to be switched to next that are loaded in the background
+# (lazy mode only). Prewarming waits until the app has been idle for
+# PREWARM_IDLE_SECONDS and host CPU is below PREWARM_MAX_CPU_PERCENT.
+PREWARM_TABS = _env_int("WAM_PREWARM_TABS", 1)
+PREWARM_IDLE_SECONDS = _env_int("WAM_PREWARM_IDLE_SECONDS", 3)
+PREWARM_MAX_CPU_PERCENT = _env_int("WAM_PREWARM_MAX_CPU_PERCENT", 50)
+
+# At most this many tabs load WhatsApp Web at the same time (the visible tab
+# is always allowed to start)
+MAX_CONCURRENT_LOADS = _env_int("WAM_MAX_CONCURRENT_LOADS", 2)
+
+# A load that has not finished after this long no longer holds a slot
+LOAD_SLOT_TIMEOUT_SECONDS = _env_int("WAM_LOAD_SLOT_TIMEOUT_SECONDS", 30)
+
+# A tab whose renderer crashes this many times within CRASH_WINDOW_MINUTES is
+# hibernated instead of being reloaded again
+CRASH_LIMIT = _env_int("WAM_CRASH_LIMIT", 3)
+CRASH_WINDOW_MINUTES = _env_int("WAM_CRASH_WINDOW_MINUTES", 10)
+
+# Tabs not used for this many minutes are hibernated (web view torn down,
+# restored on activation). 0 disables idle hibernation.
+HIBERNATE_IDLE_MINUTES = _env_int("WAM_HIBERNATE_IDLE_MINUTES", 120)
+
+# How often the idle hibernation policy runs
+HIBERNATE_CHECK_SECONDS = _env_int("WAM_HIBERNATE_CHECK_SECONDS", 60)
+
+# Total renderer memory budget in MB enforced by the memory governor.
+# 0 means half of the host's physical RAM.
+MEMORY_BUDGET_MB = _env_int("WAM_MEMORY_BUDGET_MB", 0)
+
+# How often the memory governor samples renderer RSS
+MEMORY_SAMPLE_SECONDS = _env_int("WAM_MEMORY_SAMPLE_SECONDS", 10)
+
+# How often per-tab resource telemetry (RSS, CPU) is sampled
+TELEMETRY_SAMPLE_SECONDS = _env_int("WAM_TELEMETRY_SAMPLE_SECONDS", 5)
+
+# Total disk budget in MB for all session directories. Over budget, HTTP/code
+# caches of cold accounts are cleared (login state is never touched). 0 disables.
+DISK_BUDGET_MB = _env_int("WAM_DISK_BUDGET_MB", 2048)
+
+# How often session directories are scanned, and the delay of the first scan
+STORAGE_SCAN_MINUTES = _env_int("WAM_STORAGE_SCAN_MINUTES", 30)
+STORAGE_FIRST_SCAN_SECONDS = _env_int("WAM_STORAGE_FIRST_SCAN_SECONDS", 60)
+
+# Per-account HTTP cache limits in MB. Each account gets a size between these
+# from how recently and how much it is used, recalculated every CACHE_TUNE_MINUTES.
+CACHE_MIN_MB = _env_int("WAM_CACHE_MIN_MB", 16)
+CACHE_MAX_MB = _env_int("WAM_CACHE_MAX_MB", 200)
+CACHE_TUNE_MINUTES = _env_int("WAM_CACHE_TUNE_MINUTES", 15)
+
+# Focus sessions (which account was in the foreground, and for how long) older
+# than this are pruned at startup. 0 keeps everything.
+FOCUS_RETENTION_DAYS = _env_int("WAM_FOCUS_RETENTION_DAYS", 90)
+
+# Unread badges and the window-title total are updated at most this often
+UNREAD_DEBOUNCE_MS = _env_int("WAM_UNREAD_DEBOUNCE_MS", 500)
+
+# Pages of hidden tabs are frozen (no timers or tasks) after this many seconds
+# and discarded (renderer released, reloaded when shown) after
+# DISCARD_AFTER_MINUTES. Accounts marked "needs notifications" stay active.
+# 0 disables freezing / discarding respectively.
+FREEZE_AFTER_SECONDS = _env_int("WAM_FREEZE_AFTER_SECONDS", 60)
+DISCARD_AFTER_MINUTES = _env_int("WAM_DISCARD_AFTER_MINUTES", 30)
+LIFECYCLE_CHECK_SECONDS = _env_int("WAM_LIFECYCLE_CHECK_SECONDS", 15)
+
+# Event-loop watchdog: a heartbeat timer runs every WATCHDOG_INTERVAL_MS; when
+# the GUI thread misses it for STALL_THRESHOLD_MS (0 = off) the stack of the
+# GUI thread is written to stalls.log in the data directory
+WATCHDOG_INTERVAL_MS = _env_int("WAM_WATCHDOG_INTERVAL_MS", 250)
+STALL_THRESHOLD_MS = _env_int("WAM_STALL_THRESHOLD_MS", 1000)
+
+# cProfile of tab creation/closing and database calls, written to the
+# profiles/ directory every PROFILE_DUMP_MINUTES and on exit (opt-in)
+PROFILE = _env_bool("WAM_PROFILE", False)
+PROFILE_DUMP_MINUTES = _env_int("WAM_PROFILE_DUMP_MINUTES", 5)
@@ -1,49 +1,181 @@
 import sqlite3
 import os
 import json
-import hashlib
+import threading
+import time
 from pathlib import Path
+from core import config
+from core.accounts import Account, AccountRegistry
+from core.trash import SessionTrash
+from core import passwords, migrations
+from core.profiling import profiled
+
+# Applied to every connection when it is first opened. WAL lets readers and
+# the writer work concurrently and, together with synchronous=NORMAL, avoids
+# an fsync on every single commit.
+CONNECTION_PRAGMAS = (
+    "PRAGMA journal_mode=WAL",
+    "PRAGMA synchronous=NORMAL",
+    "PRAGMA temp_store=MEMORY",
+    "PRAGMA cache_size=-2000",
+    "PRAGMA busy_timeout=5000",
+)
+
+# Seconds the write-behind thread waits after the first queued update, so a
+# burst of zoom steps or tab switches lands in a single transaction
+WRITE_BEHIND_DELAY = 1.0
+
+def _utc_timestamp():
+    """Current time in the same format as SQLite's CURRENT_TIMESTAMP"""
+    return time.strftime("%Y-%m-%d %H:%M:%S", time.gmtime())
+
+def _parse_settings(text):
+    """Decode the accounts.settings JSON column (NULL or invalid -> empty)"""
+    if not text:
+        return {}
+    try:
+        settings = json.loads(text)
+    except ValueError:
+        return {}
+    return settings if isinstance(settings, dict) else {}
 
 class Database:
-    def __init__(self):
-        self.app_data_dir = Path.home() / ".whatsapp-manager"
-        self.app_data_dir.mkdir(exist_ok=True)
+    def __init__(self, app_data_dir=None):
+        self.app_data_dir = Path(app_data_dir) if app_data_dir else config.DATA_DIR
+        self.app_data_dir.mkdir(parents=True, exist_ok=True)
         self.db_path = self.app_data_dir / "accounts.db"
+        
+        # One long-lived connection per thread, opened lazily
+        self._local = threading.local()
+        self._connections = []
+        self._connections_lock = threading.Lock()
+        
+        # Write-behind queue: account_id -> latest value (last writer wins)
+        self._pending_zoom = {}
+        self._pending_last_active = {}
+        self._pending_sessions = []
+        self._pending_lock = threading.Lock()
+        # Held from snapshot to commit so flushes from different threads commit in order
+        self._flush_lock = threading.Lock()
+        self._pending_event = threading.Event()
+        self._stop_event = threading.Event()
+        
         self.init_db()
-    
-    def init_db(self):
-        conn = sqlite3.connect(self.db_path)
-        cursor = conn.cursor()
         
-        # Create table if not exists
-        cursor.execute("""
-            CREATE TABLE IF NOT EXISTS accounts (
-                id INTEGER PRIMARY KEY AUTOINCREMENT,
-                name TEXT NOT NULL,
-                session_dir TEXT NOT NULL,
-                last_active TIMESTAMP DEFAULT CURRENT_TIMESTAMP,
-                settings TEXT
-            )
-        """)
+        # Read paths are served from memory; mutators keep this coherent
+        self.accounts = AccountRegistry()
+        self.load_accounts()
         
-        try:
-            cursor.execute("SELECT zoom_level FROM accounts LIMIT 1")
-        except sqlite3.OperationalError:
-            cursor.execute("ALTER TABLE accounts ADD COLUMN zoom_level REAL DEFAULT 1.0")
+        # Deleted session dirs are purged in the background; finish what a
+        # previous run left behind
+        self.trash = SessionTrash(self.app_data_dir / "trash")
+        self.trash.sweep()
+        # Session dirs no account refers to are only reported: they may hold
+        # a login the user still wants, so deleting them is left to the user
+        for path in self.orphaned_session_dirs():
+            print(f"Note: session directory {path} is not used by any account")
         
-        try:
-            cursor.execute("SELECT password_hash FROM accounts LIMIT 1")
-        except sqlite3.OperationalError:
-            cursor.execute("ALTER TABLE accounts ADD COLUMN password_hash TEXT")
+        self._writer = threading.Thread(target=self._writer_loop, name="db-write-behind", daemon=True)
+        self._writer.start()
+    
+    def connection(self):
+        """Get the calling thread's connection, opening it on first use"""
+        conn = getattr(self._local, "conn", None)
+        if conn is None:
+            conn = sqlite3.connect(self.db_path, check_same_thread=False)
+            for pragma in CONNECTION_PRAGMAS:
+                conn.execute(pragma)
+            self._local.conn = conn
+            with self._connections_lock:
+                self._connections.append(conn)
+        return conn
+    
+    def _writer_loop(self):
+        """Flush queued updates in the background until close() is called"""
+        self.prune_focus_sessions(config.FOCUS_RETENTION_DAYS)
+        while not self._stop_event.is_set():
+            self._pending_event.wait()
+            # Let the burst settle; close() cuts the wait short
+            self._stop_event.wait(WRITE_BEHIND_DELAY)
+            self._pending_event.clear()
+            self.flush_pending()
+    
+    def _queue_write(self, pending, account_id, value):
+        with self._pending_lock:
+            pending[account_id] = value
+        self._pending_event.set()
+    
+    @profiled
+    def flush_pending(self):
+        """Write all queued zoom/last_active updates and focus sessions in one transaction"""
+        with self._flush_lock:
+            with self._pending_lock:
+                zoom_updates = self._pending_zoom
+                last_active_updates = self._pending_last_active
+                sessions = self._pending_sessions
+                self._pending_zoom = {}
+                self._pending_last_active = {}
+                self._pending_sessions = []
+            
+            if not zoom_updates and not last_active_updates and not sessions:
+                return
+            
+            conn = self.connection()
+            try:
+                cursor = conn.cursor()
+                cursor.executemany(
+                    "UPDATE accounts SET zoom_level = ? WHERE id = ?",
+                    [(zoom, account_id) for account_id, zoom in zoom_updates.items()]
+                )
+                cursor.executemany(
+                    "UPDATE accounts SET last_active = ? WHERE id = ?",
+                    [(stamp, account_id) for account_id, stamp in last_active_updates.items()]
+                )
+                cursor.executemany(
+                    "INSERT INTO focus_sessions (account_id, started_at, duration) VALUES (?, ?, ?)",
+                    sessions
+                )
+                conn.commit()
+            except sqlite3.Error as e:
+                conn.rollback()
+                print(f"ERROR flushing queued database writes: {e}")
+    
+    def close(self):
+        """Flush queued writes and close all pooled connections (call on application exit)"""
+        self.trash.stop()
+        self._stop_event.set()
+        self._pending_event.set()
+        if self._writer.is_alive():
+            self._writer.join(timeout=5)
+        self.flush_pending()
         
-        conn.commit()
-        conn.close()
+        with self._connections_lock:
+            connections = self._connections
+            self._connections = []
+        for conn in connections:
+            try:
+                conn.close()
+            except sqlite3.Error:
+                pass
+        self._local = threading.local()
+    
+    @profiled
+    def init_db(self):
+        """Create or upgrade the schema (see core/migrations.py)"""
+        migrations.migrate(self.connection())
     
+    @profiled
     def add_account(self, name):
-        session_dir = self.app_data_dir / f"session_{name.replace(' ', '_').lower()}"
+        base = f"session_{name.replace(' ', '_').lower()}"
+        session_dir = self.app_data_dir / base
+        # Never reuse the directory of a deleted account that is still being purged
+        suffix = 1
+        while self.trash.is_pending(session_dir):
+            suffix += 1
+            session_dir = self.app_data_dir / f"{base}_{suffix}"
         session_dir.mkdir(exist_ok=True)
         
-        conn = sqlite3.connect(self.db_path)
+        conn = self.connection()
         cursor = conn.cursor()
         cursor.execute(
             "INSERT INTO accounts (name, session_dir) VALUES (?, ?)",
@@ -51,119 +183,219 @@ class Database:
         )
         account_id = cursor.lastrowid
         conn.commit()
-        conn.close()
+        
+        self.accounts.add(Account(account_id, name, str(session_dir), last_active=_utc_timestamp()))
         return account_id, str(session_dir)
     
-    def get_all_accounts(self):
-        conn = sqlite3.connect(self.db_path)
-        cursor = conn.cursor()
-        cursor.execute("SELECT id, name, session_dir, zoom_level, password_hash FROM accounts ORDER BY last_active DESC")
-        accounts = cursor.fetchall()
-        conn.close()
-        return accounts
-    
-    def update_zoom_level(self, account_id, zoom_level):
-        """Update zoom level for account"""
-        conn = sqlite3.connect(self.db_path)
+    @profiled
+    def load_accounts(self):
+        """(Re)load the account registry from disk"""
+        self.flush_pending()
+        conn = self.connection()
         cursor = conn.cursor()
         cursor.execute(
-            "UPDATE accounts SET zoom_level = ? WHERE id = ?",
-            (zoom_level, account_id)
+            "SELECT id, name, session_dir, zoom_level, password_hash, last_active, settings "
+            "FROM accounts ORDER BY last_active DESC"
         )
-        conn.commit()
-        conn.close()
+        self.accounts.load(
+            Account(account_id, name, session_dir, zoom_level if zoom_level else 1.0, password_hash, last_active,
+                    _parse_settings(settings))
+            for account_id, name, session_dir, zoom_level, password_hash, last_active, settings in cursor.fetchall()
+        )
+    
+    def get_all_accounts(self):
+        return [account.as_row() for account in self.accounts.ordered()]
+    
+    def get_account(self, account_id):
+        """Get cached Account record (or None)"""
+        return self.accounts.get(account_id)
+    
+    @profiled
+    def update_zoom_level(self, account_id, zoom_level):
+        """Update zoom level for account (queued, written behind)"""
+        self.accounts.update(account_id, zoom_level=zoom_level)
+        self._queue_write(self._pending_zoom, account_id, zoom_level)
     
+    @profiled
     def update_account_name(self, account_id, new_name):
         """Update account name"""
-        conn = sqlite3.connect(self.db_path)
+        conn = self.connection()
         cursor = conn.cursor()
         cursor.execute(
             "UPDATE accounts SET name = ? WHERE id = ?",
             (new_name, account_id)
         )
         conn.commit()
-        conn.close()
+        self.accounts.update(account_id, name=new_name)
     
-    def set_password(self, account_id, password):
-        """Set/update password for account (stores hash)"""
-        if password:
-            # Hash password with SHA256
-            password_hash = hashlib.sha256(password.encode()).hexdigest()
-        else:
-            password_hash = None
+    def get_setting(self, account_id, key, default=None):
+        """Read a per-account option from the cached settings"""
+        account = self.accounts.get(account_id)
+        if account is None:
+            return default
+        return account.settings.get(key, default)
+    
+    @profiled
+    def set_setting(self, account_id, key, value):
+        """Store a per-account option in the settings JSON column"""
+        account = self.accounts.get(account_id)
+        if account is None:
+            return
+        settings = dict(account.settings)
+        settings[key] = value
         
-        conn = sqlite3.connect(self.db_path)
+        conn = self.connection()
+        cursor = conn.cursor()
+        cursor.execute(
+            "UPDATE accounts SET settings = ? WHERE id = ?",
+            (json.dumps(settings), account_id)
+        )
+        conn.commit()
+        self.accounts.update(account_id, settings=settings)
+    
+    def set_password(self, account_id, password):
+        """Set/update password for account (hashes with the KDF; slow, keep off the GUI thread)"""
+        self.set_password_hash(account_id, passwords.hash_password(password) if password else None)
+    
+    @profiled
+    def set_password_hash(self, account_id, password_hash):
+        """Store an already computed password hash (None removes the password)"""
+        conn = self.connection()
         cursor = conn.cursor()
         cursor.execute(
             "UPDATE accounts SET password_hash = ? WHERE id = ?",
             (password_hash, account_id)
         )
         conn.commit()
-        conn.close()
+        self.accounts.update(account_id, password_hash=password_hash)
     
+    @profiled
     def verify_password(self, account_id, password):
-        """Verify password for account"""
-        conn = sqlite3.connect(self.db_path)
-        cursor = conn.cursor()
-        cursor.execute("SELECT password_hash FROM accounts WHERE id = ?", (account_id,))
-        result = cursor.fetchone()
-        conn.close()
+        """Verify password for account; old-format hashes are upgraded on success (slow, see set_password)"""
+        account = self.accounts.get(account_id)
         
-        if not result or not result[0]:
+        if not account or not account.password_hash:
             # No password set
             return True
         
-        # Compare hash
-        password_hash = hashlib.sha256(password.encode()).hexdigest()
-        return password_hash == result[0]
+        stored = account.password_hash
+        if not passwords.verify_password(password, stored):
+            return False
+        
+        if passwords.needs_rehash(stored):
+            new_hash = passwords.hash_password(password)
+            # Only if the password was not changed meanwhile
+            conn = self.connection()
+            cursor = conn.cursor()
+            cursor.execute(
+                "UPDATE accounts SET password_hash = ? WHERE id = ? AND password_hash = ?",
+                (new_hash, account_id, stored)
+            )
+            conn.commit()
+            if cursor.rowcount:
+                self.accounts.update(account_id, password_hash=new_hash)
+                print(f"Upgraded password hash of account {account_id}")
+        return True
     
     def has_password(self, account_id):
         """Check if account has password set"""
-        conn = sqlite3.connect(self.db_path)
-        cursor = conn.cursor()
-        cursor.execute("SELECT password_hash FROM accounts WHERE id = ?", (account_id,))
-        result = cursor.fetchone()
-        conn.close()
-        return result and result[0] is not None
+        account = self.accounts.get(account_id)
+        return account is not None and account.password_hash is not None
     
+    @profiled
     def delete_account(self, account_id):
-        """Delete account and its session directory"""
-        conn = sqlite3.connect(self.db_path)
+        """Delete account; its session directory is moved to the trash and purged in the background"""
+        with self._pending_lock:
+            self._pending_zoom.pop(account_id, None)
+            self._pending_last_active.pop(account_id, None)
+            self._pending_sessions = [row for row in self._pending_sessions if row[0] != account_id]
+        
+        conn = self.connection()
         cursor = conn.cursor()
         
         try:
-            # Get session directory path
-            cursor.execute("SELECT session_dir FROM accounts WHERE id = ?", (account_id,))
-            result = cursor.fetchone()
-            
-            if result:
-                import shutil, time
-                session_dir = Path(result[0])
-                
-                if session_dir.exists():
-                    max_retries = 3
-                    for attempt in range(max_retries):
-                        try:
-                            shutil.rmtree(session_dir)
-                            break
-                        except PermissionError:
-                            if attempt < max_retries - 1:
-                                time.sleep(0.5)
-            
             cursor.execute("DELETE FROM accounts WHERE id = ?", (account_id,))
+            cursor.execute("DELETE FROM focus_sessions WHERE account_id = ?", (account_id,))
             conn.commit()
-            
-        except Exception as e:
+        except Exception:
+            conn.rollback()
             raise
-        finally:
-            conn.close()
+        
+        account = self.accounts.remove(account_id)
+        if account:
+            self.trash.discard(account.session_dir)
+    
+    def orphaned_session_dirs(self):
+        """Session directories on disk that no account refers to"""
+        in_use = {Path(account.session_dir).resolve() for account in self.accounts.ordered()}
+        return [
+            path for path in self.app_data_dir.glob("session_*")
+            if path.is_dir() and path.resolve() not in in_use
+        ]
     
     def update_last_active(self, account_id):
-        conn = sqlite3.connect(self.db_path)
+        """Mark account as used now (queued, written behind)"""
+        now = _utc_timestamp()
+        self.accounts.update(account_id, last_active=now)
+        self._queue_write(self._pending_last_active, account_id, now)
+    
+    def record_focus_session(self, account_id, started_at, duration):
+        """Record that an account was in the foreground (queued, written behind)"""
+        with self._pending_lock:
+            self._pending_sessions.append((account_id, started_at, duration))
+        self._pending_event.set()
+    
+    @profiled
+    def usage_summary(self, since=None):
+        """Foreground usage per account: {account_id: (seconds, sessions, last_seen)}
+        
+        since and last_seen are Unix timestamps; queued sessions are included.
+        """
+        since = since or 0
+        conn = self.connection()
         cursor = conn.cursor()
         cursor.execute(
-            "UPDATE accounts SET last_active = CURRENT_TIMESTAMP WHERE id = ?",
-            (account_id,)
+            "SELECT account_id, SUM(duration), COUNT(*), MAX(started_at + duration) "
+            "FROM focus_sessions WHERE started_at >= ? GROUP BY account_id",
+            (since,)
         )
-        conn.commit()
-        conn.close()
+        usage = {account_id: (seconds, count, last_seen) for account_id, seconds, count, last_seen in cursor.fetchall()}
+        
+        with self._pending_lock:
+            sessions = list(self._pending_sessions)
+        for account_id, started_at, duration in sessions:
+            if started_at < since:
+                continue
+            seconds, count, last_seen = usage.get(account_id, (0.0, 0, 0.0))
+            usage[account_id] = (seconds + duration, count + 1, max(last_seen, started_at + duration))
+        return usage
+    
+    @profiled
+    def focus_sequence(self, since=None, until=None):
+        """Account ids of focus sessions started in [since, until), in chronological order"""
+        self.flush_pending()
+        conn = self.connection()
+        cursor = conn.cursor()
+        if until is None:
+            cursor.execute(
+                "SELECT account_id FROM focus_sessions WHERE started_at >= ? ORDER BY started_at",
+                (since or 0,)
+            )
+        else:
+            cursor.execute(
+                "SELECT account_id FROM focus_sessions WHERE started_at >= ? AND started_at < ? ORDER BY started_at",
+                (since or 0, until)
+            )
+        return [account_id for (account_id,) in cursor.fetchall()]
+    
+    def prune_focus_sessions(self, keep_days):
+        """Drop focus sessions older than keep_days (0 keeps everything)"""
+        if not keep_days:
+            return
+        conn = self.connection()
+        try:
+            conn.execute("DELETE FROM focus_sessions WHERE started_at < ?", (time.time() - keep_days * 86400,))
+            conn.commit()
+        except sqlite3.Error as e:
+            conn.rollback()
+            print(f"ERROR pruning focus sessions: {e}")
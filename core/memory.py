@@ -0,0 +1,77 @@
+# Process memory sampling. psutil is optional: without it every reading is
+# None and memory-based policies simply stay idle.
+try:
+    import psutil
+except ImportError:
+    psutil = None
+
+def process_rss(pid):
+    """Resident set size of a process in bytes, or None if unavailable"""
+    if psutil is None or not pid:
+        return None
+    try:
+        return psutil.Process(pid).memory_info().rss
+    except psutil.Error:
+        return None
+
+# psutil needs the same Process object between calls to report CPU usage
+_cpu_processes = {}
+
+def process_cpu_percent(pid):
+    """CPU usage of a process since the previous call for that pid, or None"""
+    if psutil is None or not pid:
+        return None
+    try:
+        process = _cpu_processes.get(pid)
+        if process is None:
+            process = _cpu_processes[pid] = psutil.Process(pid)
+        return process.cpu_percent(interval=None)
+    except psutil.Error:
+        _cpu_processes.pop(pid, None)
+        return None
+
+def forget_cpu_samples(live_pids):
+    """Drop CPU sampling state of processes that are no longer sampled (hibernated, crashed)"""
+    for pid in set(_cpu_processes) - set(live_pids):
+        del _cpu_processes[pid]
+
+def system_cpu_percent():
+    """Host-wide CPU usage since the previous call, or None if unavailable.
+    
+    Callers start a measurement window with one call and read it with the next.
+    """
+    if psutil is None:
+        return None
+    return psutil.cpu_percent(interval=None)
+
+def total_rss(pids):
+    """Sum of the RSS of all given processes that could be sampled"""
+    total = 0
+    for pid in set(pids):
+        rss = process_rss(pid)
+        if rss:
+            total += rss
+    return total
+
+def physical_memory():
+    """Total physical RAM in bytes, or None if unavailable"""
+    if psutil is None:
+        return None
+    return psutil.virtual_memory().total
+
+def memory_budget(budget_mb):
+    """Renderer memory budget in bytes: explicit MB, or half of physical RAM when 0"""
+    if budget_mb > 0:
+        return budget_mb * 1024 * 1024
+    total = physical_memory()
+    return total // 2 if total else None
+
+def renderer_limits(budget_mb):
+    """(renderer process limit, JS heap MB) sized for this host's memory budget"""
+    budget = memory_budget(budget_mb)
+    if not budget:
+        return 15, 768
+    # ~400MB per WhatsApp Web renderer
+    process_limit = max(4, min(30, budget // (400 * 1024 * 1024)))
+    heap_mb = 768 if budget >= 4 * 1024 * 1024 * 1024 else 512
+    return process_limit, heap_mb
@@ -0,0 +1,88 @@
+import sqlite3
+
+# Schema history. Each entry is (version, description, steps); a step is an
+# SQL string or a function taking the cursor. Databases created before
+# versioning (user_version 0) may already have some of these changes, so
+# steps must tolerate that. Append new migrations, never edit old ones.
+
+def _add_column(table, column, declaration):
+    def step(cursor):
+        cursor.execute(f"PRAGMA table_info({table})")
+        if column not in [row[1] for row in cursor.fetchall()]:
+            cursor.execute(f"ALTER TABLE {table} ADD COLUMN {column} {declaration}")
+    return step
+
+MIGRATIONS = (
+    (1, "accounts table", [
+        """
+        CREATE TABLE IF NOT EXISTS accounts (
+            id INTEGER PRIMARY KEY AUTOINCREMENT,
+            name TEXT NOT NULL,
+            session_dir TEXT NOT NULL,
+            last_active TIMESTAMP DEFAULT CURRENT_TIMESTAMP,
+            settings TEXT
+        )
+        """,
+    ]),
+    (2, "per-account zoom level", [
+        _add_column("accounts", "zoom_level", "REAL DEFAULT 1.0"),
+    ]),
+    (3, "per-account password", [
+        _add_column("accounts", "password_hash", "TEXT"),
+    ]),
+    (4, "focus sessions", [
+        # One row per stretch of time an account tab was in the foreground
+        """
+        CREATE TABLE IF NOT EXISTS focus_sessions (
+            id INTEGER PRIMARY KEY AUTOINCREMENT,
+            account_id INTEGER NOT NULL,
+            started_at REAL NOT NULL,
+            duration REAL NOT NULL
+        )
+        """,
+        # Covers the per-account usage aggregate without touching the table
+        "CREATE INDEX IF NOT EXISTS idx_focus_sessions_account ON focus_sessions (account_id, started_at, duration)",
+        "CREATE INDEX IF NOT EXISTS idx_focus_sessions_started ON focus_sessions (started_at)",
+    ]),
+    (5, "index for most-recently-used ordering", [
+        "CREATE INDEX IF NOT EXISTS idx_accounts_last_active ON accounts (last_active DESC)",
+    ]),
+)
+
+SCHEMA_VERSION = MIGRATIONS[-1][0]
+
+def schema_version(conn):
+    return conn.execute("PRAGMA user_version").fetchone()[0]
+
+def migrate(conn):
+    """Bring the database up to SCHEMA_VERSION in a single transaction.
+    
+    Up to date databases cost one PRAGMA read. Returns the list of applied
+    migration versions.
+    """
+    current = schema_version(conn)
+    if current >= SCHEMA_VERSION:
+        if current > SCHEMA_VERSION:
+            print(f"WARNING: database schema v{current} is newer than this app (v{SCHEMA_VERSION})")
+        return []
+    
+    applied = []
+    cursor = conn.cursor()
+    try:
+        cursor.execute("BEGIN IMMEDIATE")
+        for version, description, steps in MIGRATIONS:
+            if version <= current:
+                continue
+            for step in steps:
+                if callable(step):
+                    step(cursor)
+                else:
+                    cursor.execute(step)
+            applied.append(version)
+            print(f"Database migration {version}: {description}")
+        cursor.execute(f"PRAGMA user_version = {SCHEMA_VERSION}")
+        conn.commit()
+    except sqlite3.Error:
+        conn.rollback()
+        raise
+    return applied
@@ -0,0 +1,112 @@
+import base64
+import hashlib
+import hmac
+import os
+import queue
+import threading
+
+# Stored hash formats (fields separated by "$"):
+#   scrypt$<n>$<r>$<p>$<salt>$<hash>          current
+#   pbkdf2_sha256$<iterations>$<salt>$<hash>  where OpenSSL lacks scrypt
+#   <64 hex chars>                            legacy unsalted SHA256
+SCRYPT_N = 2 ** 14
+SCRYPT_R = 8
+SCRYPT_P = 1
+PBKDF2_ITERATIONS = 600000
+SALT_BYTES = 16
+KEY_BYTES = 32
+
+def _b64(data):
+    return base64.b64encode(data).decode("ascii")
+
+def _unb64(text):
+    return base64.b64decode(text.encode("ascii"))
+
+def _scrypt_available():
+    try:
+        hashlib.scrypt(b"", salt=b"salt", n=2, r=1, p=1)
+        return True
+    except (AttributeError, ValueError):
+        return False
+
+HAS_SCRYPT = _scrypt_available()
+
+def hash_password(password):
+    """Salted KDF hash of password in the versioned storage format"""
+    salt = os.urandom(SALT_BYTES)
+    if HAS_SCRYPT:
+        key = hashlib.scrypt(password.encode(), salt=salt, n=SCRYPT_N, r=SCRYPT_R, p=SCRYPT_P, dklen=KEY_BYTES)
+        return f"scrypt${SCRYPT_N}${SCRYPT_R}${SCRYPT_P}${_b64(salt)}${_b64(key)}"
+    key = hashlib.pbkdf2_hmac("sha256", password.encode(), salt, PBKDF2_ITERATIONS, KEY_BYTES)
+    return f"pbkdf2_sha256${PBKDF2_ITERATIONS}${_b64(salt)}${_b64(key)}"
+
+def is_legacy(stored):
+    return "$" not in stored
+
+def verify_password(password, stored):
+    """Check password against a stored hash of any supported format"""
+    try:
+        if is_legacy(stored):
+            candidate = hashlib.sha256(password.encode()).hexdigest()
+            return hmac.compare_digest(candidate, stored)
+        
+        scheme, *fields = stored.split("$")
+        if scheme == "scrypt":
+            n, r, p, salt, key = fields
+            expected = _unb64(key)
+            candidate = hashlib.scrypt(password.encode(), salt=_unb64(salt), n=int(n), r=int(r), p=int(p),
+                                       dklen=len(expected))
+        elif scheme == "pbkdf2_sha256":
+            iterations, salt, key = fields
+            expected = _unb64(key)
+            candidate = hashlib.pbkdf2_hmac("sha256", password.encode(), _unb64(salt), int(iterations), len(expected))
+        else:
+            return False
+    except (ValueError, TypeError):
+        # Malformed hash
+        return False
+    return hmac.compare_digest(candidate, expected)
+
+def needs_rehash(stored):
+    """True for hashes weaker than what hash_password() produces today"""
+    if is_legacy(stored):
+        return True
+    scheme, *fields = stored.split("$")
+    if scheme == "scrypt":
+        return [int(value) for value in fields[:3]] != [SCRYPT_N, SCRYPT_R, SCRYPT_P]
+    if scheme == "pbkdf2_sha256":
+        return HAS_SCRYPT or int(fields[0]) < PBKDF2_ITERATIONS
+    return True
+
+class PasswordWorker:
+    """Runs KDF work on a background thread so callers never wait for it.
+    
+    submit() queues a function; on_done(callback, result) is called from
+    the worker thread when it finishes (the GUI re-dispatches it to the
+    main thread).
+    """
+    
+    def __init__(self, on_done):
+        self.on_done = on_done
+        self._jobs = queue.Queue()
+        self._thread = threading.Thread(target=self._worker, name="password-kdf", daemon=True)
+        self._thread.start()
+    
+    def submit(self, func, callback):
+        self._jobs.put((func, callback))
+    
+    def stop(self):
+        self._jobs.put(None)
+    
+    def _worker(self):
+        while True:
+            job = self._jobs.get()
+            if job is None:
+                return
+            func, callback = job
+            try:
+                result = func()
+            except Exception as e:
+                print(f"ERROR in password worker: {e}")
+                result = None
+            self.on_done(callback, result)
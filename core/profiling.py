@@ -0,0 +1,80 @@
+import cProfile
+import functools
+import io
+import pstats
+import threading
+import time
+from core import config
+
+# Opt-in (WAM_PROFILE=1) profiling of hot paths. Decorated functions are timed
+# on every thread; calls on the main (GUI) thread also run under one shared
+# cProfile, started by the outermost decorated call, so nested hooks
+# (create_account_tab -> create_webview -> database) end up in a single report.
+# With profiling off, profiled() returns the function unchanged.
+
+_profiler = cProfile.Profile() if config.PROFILE else None
+_depth = 0
+_timings = {}  # name -> [calls, total seconds, max seconds]
+_timings_lock = threading.Lock()
+_session = time.strftime("%Y%m%d-%H%M%S")
+
+def profiled(func):
+    """Decorator: time func and profile it on the GUI thread when WAM_PROFILE is set"""
+    if _profiler is None:
+        return func
+    name = func.__qualname__
+
+    @functools.wraps(func)
+    def wrapper(*args, **kwargs):
+        global _depth
+        on_main_thread = threading.current_thread() is threading.main_thread()
+        outermost = on_main_thread and _depth == 0
+        if on_main_thread:
+            _depth += 1
+        if outermost:
+            _profiler.enable()
+        start = time.perf_counter()
+        try:
+            return func(*args, **kwargs)
+        finally:
+            elapsed = time.perf_counter() - start
+            if outermost:
+                _profiler.disable()
+            if on_main_thread:
+                _depth -= 1
+            with _timings_lock:
+                timing = _timings.setdefault(name, [0, 0.0, 0.0])
+                timing[0] += 1
+                timing[1] += elapsed
+                timing[2] = max(timing[2], elapsed)
+    return wrapper
+
+def report(limit=40):
+    """Text report: per-hook timings, then the hottest functions by cumulative time"""
+    with _timings_lock:
+        timings = sorted(_timings.items(), key=lambda item: -item[1][1])
+    lines = [f"{'hook':<40} {'calls':>7} {'total ms':>10} {'mean ms':>9} {'max ms':>9}"]
+    for name, (calls, total, longest) in timings:
+        lines.append(f"{name:<40} {calls:>7} {total * 1000:>10.1f} {total / calls * 1000:>9.2f} {longest * 1000:>9.1f}")
+
+    stream = io.StringIO()
+    try:
+        pstats.Stats(_profiler, stream=stream).sort_stats("cumulative").print_stats(limit)
+    except TypeError:
+        # Nothing has been profiled on the GUI thread yet
+        stream.write("No profile data yet\n")
+    return "\n".join(lines) + "\n\n" + stream.getvalue()
+
+def dump(directory):
+    """Write profile-<session>.prof (pstats) and .txt; later dumps of a session replace earlier ones"""
+    if _profiler is None or _depth:
+        return None
+    base = directory / f"profile-{_session}"
+    try:
+        directory.mkdir(parents=True, exist_ok=True)
+        _profiler.dump_stats(f"{base}.prof")
+        base.with_suffix(".txt").write_text(report(), encoding="utf-8")
+    except OSError as e:
+        print(f"ERROR writing profile: {e}")
+        return None
+    return base
@@ -0,0 +1,35 @@
+import json
+import time
+
+class StartupTimeline:
+    """Records when each cold start phase was reached, relative to process start"""
+    
+    def __init__(self):
+        self.start = time.perf_counter()
+        self.wall_start = time.time()
+        self.marks = {}
+        self.finished = False
+    
+    def mark(self, phase):
+        """Record the first time a phase is reached"""
+        if phase not in self.marks:
+            self.marks[phase] = time.perf_counter() - self.start
+    
+    def summary(self):
+        return " | ".join(f"{phase} {seconds * 1000:.0f}ms" for phase, seconds in self.marks.items())
+    
+    def finish(self, log_path=None):
+        """Print the timeline once and append it to log_path as a JSON line"""
+        if self.finished:
+            return
+        self.finished = True
+        print(f"Startup: {self.summary()}")
+        if log_path:
+            try:
+                with open(log_path, "a", encoding="utf-8") as f:
+                    f.write(json.dumps({"started": self.wall_start, "phases": self.marks}) + "\n")
+            except OSError as e:
+                print(f"ERROR writing startup timeline: {e}")
+
+# Created when main.py first imports this module, i.e. right at process start
+timeline = StartupTimeline()
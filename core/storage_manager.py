@@ -0,0 +1,135 @@
+import os
+import queue
+import shutil
+import threading
+from dataclasses import dataclass, field
+
+# Cache directories inside a session dir that can be dropped without logging
+# the account out. Auth state (IndexedDB, Local Storage, Cookies, Service
+# Worker) is never touched.
+CLEARABLE_DIRS = (
+    "cache",
+    "Code Cache",
+    "GPUCache",
+    "GrShaderCache",
+    "ShaderCache",
+    "DawnGraphiteCache",
+    "DawnWebGPUCache",
+)
+
+@dataclass
+class StorageUsage:
+    """Disk usage of one account's session directory"""
+    account_id: int
+    total_bytes: int
+    cache_bytes: int
+
+@dataclass
+class ScanResult:
+    usage: dict                                      # account_id -> StorageUsage
+    total_bytes: int
+    cleared: list = field(default_factory=list)      # account ids whose caches were deleted
+    needs_clear: list = field(default_factory=list)  # over budget but profile in use
+
+# Held while a WebEngine profile is created and while a session's caches are
+# deleted, so a profile can never come alive halfway through a deletion
+profile_lock = threading.Lock()
+
+def dir_size(path):
+    """Total size of all files below path (missing/locked files are skipped)"""
+    total = 0
+    stack = [path]
+    while stack:
+        current = stack.pop()
+        try:
+            with os.scandir(current) as entries:
+                for entry in entries:
+                    try:
+                        if entry.is_dir(follow_symlinks=False):
+                            stack.append(entry.path)
+                        elif entry.is_file(follow_symlinks=False):
+                            total += entry.stat(follow_symlinks=False).st_size
+                    except OSError:
+                        pass
+        except OSError:
+            pass
+    return total
+
+def cache_size(session_dir):
+    return sum(dir_size(os.path.join(session_dir, name)) for name in CLEARABLE_DIRS)
+
+def clear_caches(session_dir):
+    """Delete the clearable cache directories of a session dir that is not in use"""
+    for name in CLEARABLE_DIRS:
+        shutil.rmtree(os.path.join(session_dir, name), ignore_errors=True)
+
+class StorageManager:
+    """Scans session directories on a background thread and enforces a global disk budget.
+    
+    Over budget, caches of cold accounts (no live WebEngine profile) are
+    deleted least recently used first. is_live(account_id) is asked under
+    profile_lock right before each deletion; accounts whose profile is alive
+    are reported in ScanResult.needs_clear so the GUI can clear them through
+    the profile API instead of deleting files from under Chromium.
+    """
+    
+    def __init__(self, db, budget_bytes, on_scan=None, is_live=None):
+        self.db = db
+        self.budget_bytes = budget_bytes
+        self.on_scan = on_scan
+        self.is_live = is_live or (lambda account_id: False)
+        self.usage = {}
+        self._requests = queue.Queue()
+        self._thread = threading.Thread(target=self._worker, name="storage-manager", daemon=True)
+        self._thread.start()
+    
+    def request_scan(self):
+        self._requests.put(True)
+    
+    def stop(self):
+        self._requests.put(None)
+    
+    def _worker(self):
+        while True:
+            if self._requests.get() is None:
+                return
+            try:
+                result = self.scan()
+            except Exception as e:
+                print(f"ERROR scanning session directories: {e}")
+                continue
+            if self.on_scan:
+                self.on_scan(result)
+    
+    def scan(self):
+        # Least recently used first
+        accounts = list(reversed(self.db.accounts.ordered()))
+        usage = {
+            account.id: StorageUsage(account.id, dir_size(account.session_dir), cache_size(account.session_dir))
+            for account in accounts
+        }
+        total = sum(item.total_bytes for item in usage.values())
+        result = ScanResult(usage, total)
+        
+        if self.budget_bytes and total > self.budget_bytes:
+            for account in accounts:
+                if total <= self.budget_bytes:
+                    break
+                item = usage[account.id]
+                if not item.cache_bytes:
+                    continue
+                with profile_lock:
+                    # Checked now, not when the scan was queued: a lazy or
+                    # prewarmed tab may have built its profile in between
+                    if self.is_live(account.id):
+                        result.needs_clear.append(account.id)
+                        continue
+                    clear_caches(account.session_dir)
+                total -= item.cache_bytes
+                item.total_bytes -= item.cache_bytes
+                item.cache_bytes = 0
+                result.cleared.append(account.id)
+            result.total_bytes = total
+        
+        self.usage = usage
+        return result
@@ -0,0 +1,58 @@
+from collections import defaultdict
+
+class SwitchPredictor:
+    """First-order Markov model of tab switches: P(next account | current account).
+    
+    Without enough history for the current account, the tabs next to it in
+    the tab strip are predicted instead (right neighbour first).
+    """
+    
+    def __init__(self, min_observations=3):
+        self.min_observations = min_observations
+        self.transitions = defaultdict(lambda: defaultdict(int))
+    
+    def record(self, from_id, to_id):
+        if from_id is None or to_id is None or from_id == to_id:
+            return
+        self.transitions[from_id][to_id] += 1
+    
+    def train(self, sequence):
+        """Count transitions in a chronological sequence of focused account ids"""
+        previous = None
+        for account_id in sequence:
+            self.record(previous, account_id)
+            previous = account_id
+    
+    def forget(self, account_id):
+        self.transitions.pop(account_id, None)
+        for counts in self.transitions.values():
+            counts.pop(account_id, None)
+    
+    def probabilities(self, current_id):
+        counts = self.transitions.get(current_id, {})
+        total = sum(counts.values())
+        if total < self.min_observations:
+            return {}
+        return {account_id: count / total for account_id, count in counts.items()}
+    
+    def predict(self, current_id, tab_order, limit=1):
+        """Most likely next accounts among tab_order (account ids in strip order)"""
+        candidates = [account_id for account_id in tab_order if account_id != current_id]
+        probabilities = self.probabilities(current_id)
+        if probabilities:
+            ranked = sorted(
+                (account_id for account_id in candidates if probabilities.get(account_id)),
+                key=lambda account_id: -probabilities[account_id]
+            )
+            return ranked[:limit]
+        
+        if current_id not in tab_order:
+            return candidates[:limit]
+        # Adjacency fallback: right, left, then further out
+        position = tab_order.index(current_id)
+        ranked = []
+        for distance in range(1, len(tab_order)):
+            for index in (position + distance, position - distance):
+                if 0 <= index < len(tab_order):
+                    ranked.append(tab_order[index])
+        return ranked[:limit]
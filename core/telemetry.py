@@ -0,0 +1,230 @@
+import json
+import os
+import time
+from collections import deque
+from dataclasses import dataclass, asdict
+from typing import Optional
+
+@dataclass
+class TabMetrics:
+    """Resource and lifecycle counters of one account tab"""
+    account_id: int
+    name: str
+    renderer_pid: int = 0
+    rss_bytes: int = 0
+    cpu_percent: float = 0.0
+    load_count: int = 0
+    load_failures: int = 0
+    last_load_seconds: Optional[float] = None
+    total_load_seconds: float = 0.0
+    time_to_interactive: Optional[float] = None
+    crash_count: int = 0
+    disk_bytes: int = 0
+    cache_bytes: int = 0
+    foreground_seconds: float = 0.0
+    blocked_requests: int = 0
+    deferred_requests: int = 0
+    saved_bytes: int = 0
+
+# (metric name, TabMetrics field, type, help) exported to Prometheus
+PROMETHEUS_METRICS = (
+    ("wam_tab_rss_bytes", "rss_bytes", "gauge", "Resident memory of the tab's renderer process"),
+    ("wam_tab_cpu_percent", "cpu_percent", "gauge", "CPU usage of the tab's renderer process"),
+    ("wam_tab_loads_total", "load_count", "counter", "Completed page loads"),
+    ("wam_tab_load_failures_total", "load_failures", "counter", "Page loads that finished with an error"),
+    ("wam_tab_load_seconds_total", "total_load_seconds", "counter", "Time spent loading pages"),
+    ("wam_tab_last_load_seconds", "last_load_seconds", "gauge", "Duration of the most recent page load"),
+    ("wam_tab_time_to_interactive_seconds", "time_to_interactive", "gauge", "Time from load request (incl. queueing) to first page load"),
+    ("wam_tab_renderer_crashes_total", "crash_count", "counter", "Abnormal renderer terminations"),
+    ("wam_tab_foreground_seconds_total", "foreground_seconds", "counter", "Time the tab was the selected one"),
+    ("wam_tab_disk_bytes", "disk_bytes", "gauge", "Size of the account's session directory"),
+    ("wam_tab_cache_bytes", "cache_bytes", "gauge", "Clearable cache data in the session directory"),
+    ("wam_tab_blocked_requests_total", "blocked_requests", "counter", "Requests blocked by the request filter"),
+    ("wam_tab_deferred_requests_total", "deferred_requests", "counter", "Requests of a hidden tab deferred by the request filter"),
+    ("wam_tab_saved_bytes_total", "saved_bytes", "counter", "Estimated transfer saved by the request filter"),
+)
+
+def _percentile(values, fraction):
+    if not values:
+        return None
+    ordered = sorted(values)
+    return ordered[min(len(ordered) - 1, int(fraction * len(ordered)))]
+
+def _label(value):
+    return str(value).replace("\\", "\\\\").replace("\"", "\\\"").replace("\n", "\\n")
+
+class Telemetry:
+    """Per-tab metrics collected by the GUI and exported as JSON or Prometheus text"""
+    
+    def __init__(self):
+        self.tabs = {}
+        self._load_started = {}
+        
+        # Tab switching and predictive prewarming
+        self.switches = 0
+        self.prewarms = 0
+        self.prewarm_hits = 0
+        self.switch_latencies = deque(maxlen=500)
+        
+        # GUI event loop responsiveness (diagnostics heartbeat)
+        self.loop_latencies = deque(maxlen=1000)
+        self.stalls = 0
+        self.stall_seconds = 0.0
+    
+    def tab(self, account_id, name=None):
+        """Get (or create) the metrics of an account"""
+        metrics = self.tabs.get(account_id)
+        if metrics is None:
+            metrics = TabMetrics(account_id, name or str(account_id))
+            self.tabs[account_id] = metrics
+        elif name:
+            metrics.name = name
+        return metrics
+    
+    def remove(self, account_id):
+        self.tabs.pop(account_id, None)
+        self._load_started.pop(account_id, None)
+    
+    def load_started(self, account_id):
+        self._load_started[account_id] = time.perf_counter()
+    
+    def load_finished(self, account_id, ok):
+        started = self._load_started.pop(account_id, None)
+        metrics = self.tab(account_id)
+        if ok:
+            metrics.load_count += 1
+        else:
+            metrics.load_failures += 1
+        if started is not None:
+            duration = time.perf_counter() - started
+            metrics.last_load_seconds = duration
+            metrics.total_load_seconds += duration
+        return metrics.last_load_seconds
+    
+    def interactive(self, account_id, seconds):
+        self.tab(account_id).time_to_interactive = seconds
+    
+    def foreground(self, account_id, seconds):
+        self.tab(account_id).foreground_seconds += seconds
+    
+    def crashed(self, account_id):
+        self.tab(account_id).crash_count += 1
+    
+    def update_process(self, account_id, pid, rss, cpu):
+        metrics = self.tab(account_id)
+        metrics.renderer_pid = pid or 0
+        metrics.rss_bytes = rss or 0
+        metrics.cpu_percent = cpu or 0.0
+    
+    def update_requests(self, account_id, stats):
+        """Copy the request filter counters (RequestStats) of an account"""
+        metrics = self.tab(account_id)
+        metrics.blocked_requests = stats.blocked
+        metrics.deferred_requests = stats.deferred
+        metrics.saved_bytes = stats.saved_bytes
+    
+    def prewarmed(self):
+        self.prewarms += 1
+    
+    def switched(self, latency, prewarm_hit):
+        """A tab switch completed: latency until the page was usable"""
+        self.switches += 1
+        self.switch_latencies.append(latency)
+        if prewarm_hit:
+            self.prewarm_hits += 1
+    
+    def switch_stats(self):
+        latencies = list(self.switch_latencies)
+        return {
+            "switches": self.switches,
+            "prewarms": self.prewarms,
+            "prewarm_hits": self.prewarm_hits,
+            "hit_rate": self.prewarm_hits / self.prewarms if self.prewarms else None,
+            "latency_p50": _percentile(latencies, 0.5),
+            "latency_p95": _percentile(latencies, 0.95),
+        }
+    
+    def loop_latency(self, seconds):
+        """How late the event loop delivered a heartbeat"""
+        self.loop_latencies.append(seconds)
+    
+    def stalled(self, seconds):
+        """The GUI thread was blocked past the stall threshold"""
+        self.stalls += 1
+        self.stall_seconds += seconds
+    
+    def loop_stats(self):
+        latencies = list(self.loop_latencies)
+        return {
+            "stalls": self.stalls,
+            "stall_seconds": self.stall_seconds,
+            "latency_p50": _percentile(latencies, 0.5),
+            "latency_p95": _percentile(latencies, 0.95),
+            "latency_max": max(latencies) if latencies else None,
+        }
+    
+    def snapshot(self):
+        return [asdict(metrics) for metrics in self.tabs.values()]
+    
+    def to_prometheus(self):
+        lines = []
+        for metric, field, kind, help_text in PROMETHEUS_METRICS:
+            lines.append(f"# HELP {metric} {help_text}")
+            lines.append(f"# TYPE {metric} {kind}")
+            for metrics in self.tabs.values():
+                value = getattr(metrics, field)
+                if value is None:
+                    continue
+                labels = f'account_id="{metrics.account_id}",account="{_label(metrics.name)}"'
+                lines.append(f"{metric}{{{labels}}} {value}")
+        
+        stats = self.switch_stats()
+        lines += [
+            "# HELP wam_tab_switches_total Tab switches",
+            "# TYPE wam_tab_switches_total counter",
+            f"wam_tab_switches_total {stats['switches']}",
+            "# HELP wam_prewarms_total Background tabs loaded ahead of a predicted switch",
+            "# TYPE wam_prewarms_total counter",
+            f"wam_prewarms_total {stats['prewarms']}",
+            "# HELP wam_prewarm_hits_total Switches that landed on a prewarmed tab",
+            "# TYPE wam_prewarm_hits_total counter",
+            f"wam_prewarm_hits_total {stats['prewarm_hits']}",
+            "# HELP wam_switch_latency_seconds Time from tab switch until the page is usable",
+            "# TYPE wam_switch_latency_seconds summary",
+        ]
+        for quantile, key in (("0.5", "latency_p50"), ("0.95", "latency_p95")):
+            if stats[key] is not None:
+                lines.append(f'wam_switch_latency_seconds{{quantile="{quantile}"}} {stats[key]}')
+        
+        loop = self.loop_stats()
+        lines += [
+            "# HELP wam_gui_stalls_total Times the GUI thread was blocked past the stall threshold",
+            "# TYPE wam_gui_stalls_total counter",
+            f"wam_gui_stalls_total {loop['stalls']}",
+            "# HELP wam_gui_stall_seconds_total Time the GUI thread spent in stalls",
+            "# TYPE wam_gui_stall_seconds_total counter",
+            f"wam_gui_stall_seconds_total {loop['stall_seconds']}",
+            "# HELP wam_event_loop_latency_seconds Delay of the event loop heartbeat",
+            "# TYPE wam_event_loop_latency_seconds summary",
+        ]
+        for quantile, key in (("0.5", "latency_p50"), ("0.95", "latency_p95")):
+            if loop[key] is not None:
+                lines.append(f'wam_event_loop_latency_seconds{{quantile="{quantile}"}} {loop[key]}')
+        return "\n".join(lines) + "\n"
+    
+    def export_json(self, path):
+        data = {"timestamp": time.time(), "tabs": self.snapshot(), "switching": self.switch_stats(),
+                "event_loop": self.loop_stats()}
+        self._write(path, json.dumps(data, indent=2))
+    
+    def export_prometheus(self, path):
+        self._write(path, self.to_prometheus())
+    
+    def _write(self, path, text):
+        # Write-then-rename so scrapers never see a half written file
+        path = str(path)
+        os.makedirs(os.path.dirname(path) or ".", exist_ok=True)
+        tmp_path = path + ".tmp"
+        with open(tmp_path, "w", encoding="utf-8") as f:
+            f.write(text)
+        os.replace(tmp_path, path)
@@ -0,0 +1,94 @@
+import os
+import queue
+import shutil
+import threading
+import time
+from pathlib import Path
+
+# Seconds between purge attempts of a directory that is still locked (e.g. a
+# Chromium profile that has not been released yet); doubles up to the maximum
+PURGE_RETRY_DELAY = 0.5
+PURGE_RETRY_MAX_DELAY = 30
+PURGE_ATTEMPTS = 8
+
+class SessionTrash:
+    """Two-phase removal of session directories.
+
+    discard() moves a directory into the trash area with a single rename,
+    which is instant; the actual delete happens on a background thread with
+    retries. Whatever is left in the trash (app closed mid-purge, files still
+    locked) is purged again by sweep() on the next start.
+    """
+
+    def __init__(self, trash_dir):
+        self.trash_dir = Path(trash_dir)
+        self.trash_dir.mkdir(parents=True, exist_ok=True)
+        self._pending = set()
+        self._pending_lock = threading.Lock()
+        self._requests = queue.Queue()
+        self._stopped = threading.Event()
+        self._thread = threading.Thread(target=self._worker, name="session-trash", daemon=True)
+        self._thread.start()
+
+    def discard(self, path):
+        """Move path out of the way and queue it for deletion"""
+        path = Path(path)
+        if not path.exists():
+            return
+        target = self.trash_dir / f"{path.name}-{time.time_ns()}"
+        try:
+            os.replace(path, target)
+        except OSError as e:
+            # Files still held open (Windows): purge in place, the worker retries
+            print(f"Could not move {path} to trash ({e}); deleting in place")
+            target = path
+        self._queue(target)
+
+    def is_pending(self, path):
+        """True while path is still waiting to be purged in place"""
+        with self._pending_lock:
+            return Path(path) in self._pending
+
+    def sweep(self):
+        """Queue trash entries a previous run did not finish purging"""
+        for entry in self.trash_dir.iterdir():
+            self._queue(entry)
+
+    def stop(self):
+        """Stop the worker; unfinished entries are picked up by the next sweep()"""
+        self._stopped.set()
+        self._requests.put(None)
+
+    def _queue(self, path):
+        with self._pending_lock:
+            self._pending.add(Path(path))
+        self._requests.put(Path(path))
+
+    def _worker(self):
+        while True:
+            path = self._requests.get()
+            if path is None:
+                return
+            self.purge(path)
+            with self._pending_lock:
+                self._pending.discard(path)
+
+    def purge(self, path):
+        """Delete path, retrying with backoff while files are locked"""
+        delay = PURGE_RETRY_DELAY
+        for attempt in range(PURGE_ATTEMPTS):
+            try:
+                if path.is_dir():
+                    shutil.rmtree(path)
+                elif path.exists():
+                    path.unlink()
+                return True
+            except OSError as e:
+                if attempt == PURGE_ATTEMPTS - 1:
+                    print(f"Giving up on deleting {path} for now: {e}")
+                    return False
+            # stop() cuts the wait short
+            if self._stopped.wait(delay):
+                return False
+            delay = min(delay * 2, PURGE_RETRY_MAX_DELAY)
+        return False
@@ -0,0 +1,12 @@
+import re
+
+# WhatsApp Web puts the number of unread chats in front of the page title:
+# "(3) WhatsApp". Large counts may be shown with a separator ("1.024", "1,024").
+UNREAD_TITLE = re.compile(r"^\s*\((\d[\d.,]*)\+?\)")
+
+def unread_count(title):
+    """Unread chats announced by a page title (0 if it shows none)"""
+    match = UNREAD_TITLE.match(title or "")
+    if match is None:
+        return 0
+    return int(re.sub(r"[.,]", "", match.group(1)))
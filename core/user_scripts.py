@@ -0,0 +1,59 @@
+import json
+from dataclasses import dataclass
+from pathlib import Path
+
+INJECTION_POINTS = ("document_creation", "document_ready", "deferred")
+WORLDS = ("main", "application")
+
+@dataclass(frozen=True)
+class UserScript:
+    """One script of the bundle, ready to be turned into a QWebEngineScript"""
+    name: str
+    source: str
+    injection_point: str = "document_creation"
+    world: str = "main"
+    subframes: bool = True
+
+@dataclass(frozen=True)
+class ScriptBundle:
+    version: int
+    scripts: tuple
+
+EMPTY_BUNDLE = ScriptBundle(0, ())
+
+# bundle_dir -> ScriptBundle; the bundle is read from disk once per process
+_bundles = {}
+
+def load_bundle(bundle_dir):
+    """Scripts listed in bundle_dir/manifest.json (cached after the first call).
+    
+    A missing or broken bundle is reported and yields no scripts, so pages still load.
+    """
+    bundle_dir = Path(bundle_dir)
+    bundle = _bundles.get(bundle_dir)
+    if bundle is None:
+        bundle = _read_bundle(bundle_dir)
+        _bundles[bundle_dir] = bundle
+    return bundle
+
+def _read_bundle(bundle_dir):
+    try:
+        manifest = json.loads((bundle_dir / "manifest.json").read_text(encoding="utf-8"))
+        scripts = []
+        for entry in manifest["scripts"]:
+            script = UserScript(
+                name=entry["name"],
+                source=(bundle_dir / entry["file"]).read_text(encoding="utf-8"),
+                injection_point=entry.get("injection_point", "document_creation"),
+                world=entry.get("world", "main"),
+                subframes=bool(entry.get("subframes", True)),
+            )
+            if script.injection_point not in INJECTION_POINTS or script.world not in WORLDS:
+                raise ValueError(f"bad injection point or world for script '{script.name}'")
+            scripts.append(script)
+        bundle = ScriptBundle(int(manifest["version"]), tuple(scripts))
+    except (OSError, KeyError, TypeError, ValueError) as e:
+        print(f"ERROR loading user scripts from {bundle_dir}: {e}")
+        return EMPTY_BUNDLE
+    print(f"Loaded user script bundle v{bundle.version} ({len(bundle.scripts)} scripts)")
+    return bundle
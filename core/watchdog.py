@@ -0,0 +1,65 @@
+import sys
+import threading
+import time
+import traceback
+
+class StallWatchdog:
+    """Detects a blocked GUI thread and records what it was doing.
+
+    The GUI thread calls beat() from a heartbeat timer. A background thread
+    checks the time since the last beat; once it exceeds the threshold, the
+    Python stack of the watched thread is captured through
+    sys._current_frames() and written to log_path. One report per stall.
+    """
+
+    def __init__(self, threshold_seconds, log_path=None, thread_id=None):
+        self.threshold = threshold_seconds
+        self.log_path = log_path
+        self.thread_id = thread_id or threading.main_thread().ident
+        self.last_beat = time.monotonic()
+        self.reported = False  # the current stall has been written already
+        self.stalls = 0
+        self._stopped = threading.Event()
+        self._thread = threading.Thread(target=self._worker, name="stall-watchdog", daemon=True)
+        self._thread.start()
+
+    def beat(self):
+        """The watched thread is responsive; returns the length of the stall it just left (or 0)"""
+        now = time.monotonic()
+        gap = now - self.last_beat
+        self.last_beat = now
+        if self.reported:
+            self.reported = False
+            print(f"GUI thread responsive again after {gap:.1f}s")
+            return gap
+        return 0.0
+
+    def stop(self):
+        self._stopped.set()
+
+    def _worker(self):
+        # Check a few times per threshold so a stall is caught close to it
+        interval = max(self.threshold / 4, 0.05)
+        while not self._stopped.wait(interval):
+            blocked = time.monotonic() - self.last_beat
+            if blocked >= self.threshold and not self.reported:
+                self.reported = True
+                self.stalls += 1
+                self.report(blocked)
+
+    def capture_stack(self):
+        frame = sys._current_frames().get(self.thread_id)
+        if frame is None:
+            return "(thread not running)\n"
+        return "".join(traceback.format_stack(frame))
+
+    def report(self, blocked):
+        stack = self.capture_stack()
+        header = f"{time.strftime('%Y-%m-%d %H:%M:%S')} GUI thread blocked for {blocked:.2f}s"
+        print(f"WARNING: {header}\n{stack}")
+        if self.log_path:
+            try:
+                with open(self.log_path, "a", encoding="utf-8") as f:
+                    f.write(f"{header}\n{stack}\n")
+            except OSError as e:
+                print(f"ERROR writing stall report: {e}")
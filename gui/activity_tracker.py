@@ -0,0 +1,81 @@
+import time
+from PyQt6.QtCore import QObject, Qt
+from PyQt6.QtWidgets import QApplication
+
+# Switches shorter than this (cycling through tabs) are not recorded as sessions
+MIN_SESSION_SECONDS = 1.0
+
+class ActivityTracker(QObject):
+    """Records which account is in the foreground, and for how long.
+    
+    A focus session runs while an account's tab is selected and the app is
+    active. Sessions are written behind to the focus_sessions table; policies
+    read the aggregate through usage().
+    """
+    
+    def __init__(self, main_window):
+        super().__init__(main_window)
+        self.main_window = main_window
+        self.db = main_window.db
+        self.telemetry = main_window.telemetry
+        self.account_id = None
+        self.started_at = None  # wall clock, stored
+        self.started = None     # monotonic, for the duration
+        
+        app = QApplication.instance()
+        if app is not None:
+            app.applicationStateChanged.connect(self.on_application_state_changed)
+    
+    def focus_changed(self, account_id):
+        """The selected tab changed (QTabWidget.currentChanged)"""
+        self.end_session()
+        self.account_id = account_id
+        if account_id is not None:
+            self.db.update_last_active(account_id)
+            if QApplication.applicationState() == Qt.ApplicationState.ApplicationActive:
+                self.begin_session()
+    
+    def on_application_state_changed(self, state):
+        # Time spent in other applications is not foreground time
+        if state == Qt.ApplicationState.ApplicationActive:
+            if self.account_id is not None and self.started is None:
+                self.begin_session()
+        else:
+            self.end_session()
+    
+    def begin_session(self):
+        self.started_at = time.time()
+        self.started = time.monotonic()
+    
+    def end_session(self):
+        """Close the running session, if any, and queue it for writing"""
+        if self.account_id is None or self.started is None:
+            return
+        duration = time.monotonic() - self.started
+        self.started = None
+        if self.account_id not in self.main_window.tabs:
+            return
+        # The account was in use until now
+        self.db.update_last_active(self.account_id)
+        self.telemetry.foreground(self.account_id, duration)
+        if duration >= MIN_SESSION_SECONDS:
+            self.db.record_focus_session(self.account_id, self.started_at, duration)
+    
+    def current_seconds(self, account_id):
+        """Length of the running session if it belongs to account_id"""
+        if account_id != self.account_id or self.started is None:
+            return 0.0
+        return time.monotonic() - self.started
+    
+    def usage(self, days=None):
+        """Foreground seconds per account, including the running session"""
+        since = time.time() - days * 86400 if days else None
+        usage = {account_id: seconds for account_id, (seconds, _, _) in self.db.usage_summary(since).items()}
+        if self.account_id is not None:
+            usage[self.account_id] = usage.get(self.account_id, 0.0) + self.current_seconds(self.account_id)
+        return usage
+    
+    def stop(self):
+        """Close the running session (call before the database is closed)"""
+        self.end_session()
+        self.account_id = None
@@ -0,0 +1,38 @@
+from PyQt6.QtCore import QObject, QTimer
+from core import config
+from core.cache_policy import cache_sizes
+from gui.tab_hibernator import idle_seconds
+
+# Foreground time is weighed over this many recent days
+USAGE_WINDOW_DAYS = 14
+
+class CacheTuner(QObject):
+    """Sizes each account's HTTP cache from its activity: hot accounts get warm caches"""
+    
+    def __init__(self, main_window):
+        super().__init__(main_window)
+        self.main_window = main_window
+        self.sizes = {}
+        
+        self.timer = QTimer(self)
+        self.timer.timeout.connect(self.update)
+        self.timer.start(config.CACHE_TUNE_MINUTES * 60 * 1000)
+        self.update()
+    
+    def update(self):
+        """Recompute limits; new profiles pick them up, live ones are resized in place"""
+        usage = self.main_window.activity.usage(days=USAGE_WINDOW_DAYS)
+        activity = []
+        for account_id in self.main_window.tabs:
+            account = self.main_window.db.get_account(account_id)
+            idle = idle_seconds(account.last_active if account else None)
+            activity.append((account_id, idle, usage.get(account_id, 0.0)))
+        
+        self.sizes = cache_sizes(activity, config.CACHE_MIN_MB * 1024 * 1024, config.CACHE_MAX_MB * 1024 * 1024)
+        for account_id, size in self.sizes.items():
+            tab = self.main_window.tabs[account_id]["widget"]
+            if tab.cache_size == size:
+                continue
+            tab.cache_size = size
+            if tab.profile:
+                tab.profile.setHttpCacheMaximumSize(size)
@@ -0,0 +1,53 @@
+import time
+from PyQt6.QtCore import QObject, QTimer
+from core import config, profiling
+from core.watchdog import StallWatchdog
+
+class Diagnostics(QObject):
+    """Event-loop latency, stall reports and (opt-in) profile dumps.
+    
+    A heartbeat timer measures how late the event loop delivers it and keeps
+    the stall watchdog fed; when the GUI thread stops beating, the watchdog
+    thread logs its stack to stalls.log.
+    """
+    
+    def __init__(self, main_window):
+        super().__init__(main_window)
+        self.main_window = main_window
+        self.telemetry = main_window.telemetry
+        self.interval = config.WATCHDOG_INTERVAL_MS / 1000
+        self.profile_dir = main_window.db.app_data_dir / "profiles"
+        
+        self.watchdog = None
+        if config.STALL_THRESHOLD_MS > 0:
+            self.watchdog = StallWatchdog(config.STALL_THRESHOLD_MS / 1000, main_window.db.app_data_dir / "stalls.log")
+        
+        self.last_beat = time.monotonic()
+        self.timer = QTimer(self)
+        self.timer.timeout.connect(self.beat)
+        self.timer.start(config.WATCHDOG_INTERVAL_MS)
+        
+        if config.PROFILE:
+            print(f"Profiling enabled, reports go to {self.profile_dir}")
+            self.profile_timer = QTimer(self)
+            self.profile_timer.timeout.connect(self.dump_profile)
+            self.profile_timer.start(config.PROFILE_DUMP_MINUTES * 60 * 1000)
+    
+    def beat(self):
+        now = time.monotonic()
+        self.telemetry.loop_latency(max(0.0, now - self.last_beat - self.interval))
+        self.last_beat = now
+        if self.watchdog:
+            stalled = self.watchdog.beat()
+            if stalled:
+                self.telemetry.stalled(stalled)
+    
+    def dump_profile(self):
+        profiling.dump(self.profile_dir)
+    
+    def stop(self):
+        self.timer.stop()
+        if self.watchdog:
+            self.watchdog.stop()
+        if config.PROFILE:
+            self.dump_profile()
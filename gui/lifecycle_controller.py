@@ -0,0 +1,78 @@
+import time
+from PyQt6.QtCore import QObject, QTimer
+from core import config
+
+# Per-account setting: keep the page active while hidden so notifications
+# keep arriving in real time
+NEEDS_NOTIFICATIONS = "needs_notifications"
+
+# Deeper states last; a page is never moved past what Chromium recommends
+STATE_ORDER = ("active", "frozen", "discarded")
+
+class LifecycleController(QObject):
+    """Freezes, then discards, the pages of tabs that stay hidden.
+    
+    Frozen pages keep their renderer but run no tasks or timers; discarded
+    pages release the renderer and reload when shown again. Accounts marked
+    "needs notifications" are left active.
+    """
+    
+    def __init__(self, main_window):
+        super().__init__(main_window)
+        self.main_window = main_window
+        self.hidden_since = {}  # account_id -> monotonic time the tab was hidden
+        
+        self.timer = QTimer(self)
+        self.timer.timeout.connect(self.check)
+        if config.FREEZE_AFTER_SECONDS > 0:
+            self.timer.start(config.LIFECYCLE_CHECK_SECONDS * 1000)
+    
+    def needs_notifications(self, tab):
+        return bool(self.main_window.db.get_setting(tab.account_id, NEEDS_NOTIFICATIONS, False))
+    
+    def set_needs_notifications(self, tab, enabled):
+        self.main_window.db.set_setting(tab.account_id, NEEDS_NOTIFICATIONS, enabled)
+        if enabled:
+            tab.set_lifecycle_state("active")
+    
+    def tab_switched(self, tab):
+        """Start the hidden clock of every other tab; the shown page reactivates itself"""
+        now = time.monotonic()
+        for account_id in self.main_window.tabs:
+            if tab is None or account_id != tab.account_id:
+                self.hidden_since.setdefault(account_id, now)
+        if tab is not None:
+            self.hidden_since.pop(tab.account_id, None)
+    
+    def target_state(self, tab, hidden_seconds):
+        if self.needs_notifications(tab):
+            return "active"
+        state = "active"
+        if hidden_seconds >= config.FREEZE_AFTER_SECONDS:
+            state = "frozen"
+        if config.DISCARD_AFTER_MINUTES > 0 and hidden_seconds >= config.DISCARD_AFTER_MINUTES * 60:
+            state = "discarded"
+        
+        # Chromium keeps pages active while they play audio, load or show a dialog
+        recommended = tab.web_view.page().recommendedState().name.lower()
+        if STATE_ORDER.index(recommended) < STATE_ORDER.index(state):
+            state = recommended
+        return state
+    
+    def check(self):
+        now = time.monotonic()
+        current = self.main_window.get_active_tab_widget()
+        for account_id, info in list(self.main_window.tabs.items()):
+            tab = info["widget"]
+            if tab is current or not tab.web_view or not tab.page_ready:
+                continue
+            hidden = now - self.hidden_since.setdefault(account_id, now)
+            state = self.target_state(tab, hidden)
+            # Only ever deeper: pages come back when shown, and the memory
+            # governor may already have discarded this one
+            if STATE_ORDER.index(state) > STATE_ORDER.index(tab.lifecycle_state):
+                print(f"Lifecycle: '{tab.name}' {tab.lifecycle_state} -> {state}")
+                tab.set_lifecycle_state(state)
+    
+    def forget(self, account_id):
+        self.hidden_since.pop(account_id, None)
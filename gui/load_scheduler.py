@@ -0,0 +1,89 @@
+import time
+from PyQt6.QtCore import QObject, QTimer
+from core import config
+from core.startup_timeline import timeline
+
+class LoadScheduler(QObject):
+    """Admits at most MAX_CONCURRENT_LOADS WhatsApp Web loads at a time.
+    
+    Pending tabs are started most recently used first. The tab the user is
+    looking at is never kept waiting: it starts immediately, even when all
+    slots are busy.
+    """
+    
+    def __init__(self, main_window):
+        super().__init__(main_window)
+        self.main_window = main_window
+        self.db = main_window.db
+        self.telemetry = main_window.telemetry
+        self.max_concurrent = max(1, config.MAX_CONCURRENT_LOADS)
+        self.pending = {}  # account_id -> (tab, time requested)
+        self.active = {}   # account_id -> (tab, time requested, load token)
+        self._token = 0
+    
+    def request(self, tab):
+        """Queue a tab's initial WhatsApp Web load"""
+        if tab.account_id in self.pending or tab.account_id in self.active:
+            return
+        self.pending[tab.account_id] = (tab, time.perf_counter())
+        QTimer.singleShot(0, self.pump)
+    
+    def cancel(self, tab):
+        """Forget a tab that was hibernated or closed before its load finished"""
+        self.pending.pop(tab.account_id, None)
+        if self.active.pop(tab.account_id, None):
+            QTimer.singleShot(0, self.pump)
+    
+    def next_tab(self):
+        """Active tab first, then most recently used"""
+        current = self.main_window.get_active_tab_widget()
+        if current is not None and current.account_id in self.pending:
+            return current.account_id
+        
+        def last_active(account_id):
+            account = self.db.get_account(account_id)
+            return account.last_active or "" if account else ""
+        
+        return max(self.pending, key=last_active)
+    
+    def pump(self):
+        # Foreground tab skips the queue
+        current = self.main_window.get_active_tab_widget()
+        if current is not None and current.account_id in self.pending:
+            self.start(current.account_id)
+        
+        while self.pending and len(self.active) < self.max_concurrent:
+            self.start(self.next_tab())
+    
+    def start(self, account_id):
+        tab, requested = self.pending.pop(account_id)
+        self._token += 1
+        token = self._token
+        self.active[account_id] = (tab, requested, token)
+        
+        tab.load_whatsapp()
+        
+        # Never let a load that never reports back hold a slot forever
+        QTimer.singleShot(config.LOAD_SLOT_TIMEOUT_SECONDS * 1000, lambda: self.expire(account_id, token))
+    
+    def expire(self, account_id, token):
+        entry = self.active.get(account_id)
+        if entry and entry[2] == token:
+            print(f"Load of '{entry[0].name}' timed out, releasing its slot")
+            del self.active[account_id]
+            self.pump()
+    
+    def load_finished(self, tab, ok):
+        """Called by a tab when its page finished loading"""
+        entry = self.active.pop(tab.account_id, None)
+        if entry is None:
+            return
+        
+        if ok:
+            tti = time.perf_counter() - entry[1]
+            self.telemetry.interactive(tab.account_id, tti)
+            print(f"'{tab.name}' interactive after {tti:.2f}s")
+            
+            timeline.mark("first_tab_interactive")
+            timeline.finish(self.db.app_data_dir / "startup.log")
+        self.pump()
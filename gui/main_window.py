@@ -1,9 +1,30 @@
+import time
 from PyQt6.QtWidgets import (QMainWindow, QWidget, QVBoxLayout, QHBoxLayout, 
                               QPushButton, QTabWidget, QLabel, QInputDialog, QMessageBox, QLineEdit, QMenu)
-from PyQt6.QtCore import Qt
+from PyQt6.QtCore import Qt, QTimer
 from PyQt6.QtGui import QIcon, QAction
+from core import config
 from core.database import Database
+from core.telemetry import Telemetry
+from core.request_rules import CATEGORIES
+from core.startup_timeline import timeline
+from core.profiling import profiled
 from gui.whatsapp_tab import WhatsAppTab
+from gui.tab_hibernator import TabHibernator
+from gui.telemetry_panel import TelemetryPanel
+from gui.load_scheduler import LoadScheduler
+from gui.storage_monitor import StorageMonitor
+from gui.cache_tuner import CacheTuner
+from gui.activity_tracker import ActivityTracker
+from gui.prewarmer import Prewarmer
+from gui.lifecycle_controller import LifecycleController
+from gui.password_service import PasswordService
+from gui.request_filter import RequestFilter
+from gui.unread_badges import UnreadBadges
+from gui.diagnostics import Diagnostics
+from gui.tab_registry import TabRegistry
+from gui.recovery import RecoverySupervisor, STATE_RECOVERING, STATE_TRIPPED
+from gui.memory_governor import MemoryGovernor, LEVEL_NORMAL, LEVEL_TRIM, LEVEL_HIBERNATE
 
 class MainWindow(QMainWindow):
     def __init__(self):
@@ -14,15 +35,58 @@ class MainWindow(QMainWindow):
         self.resize(1200, 800)
         
         self.db = Database()
-        self.tabs = {}
+        timeline.mark("database")
+        self.telemetry = Telemetry()
+        self.load_scheduler = LoadScheduler(self)
+        self.recovery = RecoverySupervisor(self)
         self.welcome_tab = None
+        self.current_account_id = None
+        self.activity = ActivityTracker(self)
+        self.prewarmer = Prewarmer(self)
+        self.lifecycle = LifecycleController(self)
+        self.passwords = PasswordService(self.db, self)
+        self.request_filter = RequestFilter(self)
+        self.unread_badges = UnreadBadges(self)
+        self.diagnostics = Diagnostics(self)
+        self.first_paint_done = False
         
         self.setup_ui()
         self.apply_styles()
         self.setup_shortcuts()
         self.load_saved_accounts()
         self.show_welcome_if_empty()
+        timeline.mark("tab_strip")
+        
+        self.hibernator = TabHibernator(self)
+        self.memory_governor = MemoryGovernor(self)
+        self.memory_governor.status_changed.connect(self.update_memory_status)
+        self.storage_monitor = StorageMonitor(self)
+        self.cache_tuner = CacheTuner(self)
+
+    def paintEvent(self, event):
+        super().paintEvent(event)
+        if not self.first_paint_done:
+            self.first_paint_done = True
+            timeline.mark("first_paint")
+            # Build the first web view only once the window is on screen
+            QTimer.singleShot(0, self.start_initial_tab)
+    
+    def start_initial_tab(self):
+        """Activate the current account tab after first paint"""
+        if not self.tabs:
+            timeline.finish(self.db.app_data_dir / "startup.log")
+            return
+        self.on_current_tab_changed(self.tab_widget.currentIndex())
     
+    def closeEvent(self, event):
+        """Stop background workers and release database connections"""
+        self.storage_monitor.stop()
+        self.activity.stop()
+        self.passwords.stop()
+        self.diagnostics.stop()
+        self.db.close()
+        super().closeEvent(event)
+
     def setup_ui(self):
         central_widget = QWidget()
         self.setCentralWidget(central_widget)
@@ -40,7 +104,8 @@ class MainWindow(QMainWindow):
         self.tab_widget.customContextMenuRequested.connect(self.show_tab_context_menu)
         self.tab_widget.tabCloseRequested.connect(self.close_tab)
         
-        # Connect tab bar moved signal to update indices
+        # account_id <-> tab widget, positions derived from the tab bar
+        self.tabs = TabRegistry(self.tab_widget)
         self.tab_widget.tabBar().tabMoved.connect(self.on_tab_moved)
         
         # Global controls bar (zoom, lock, reload, add) - all in tab bar
@@ -120,8 +185,26 @@ class MainWindow(QMainWindow):
         
         # Update controls when tab changes
         self.tab_widget.currentChanged.connect(self.update_global_controls)
+        self.tab_widget.currentChanged.connect(self.on_current_tab_changed)
         
         main_layout.addWidget(self.tab_widget)
+        
+        # Memory status (filled in by the memory governor)
+        self.memory_label = QLabel("")
+        self.memory_label.setObjectName("memory_label")
+        self.statusBar().addPermanentWidget(self.memory_label)
+        
+        # Per-tab resource monitor (hidden until toggled)
+        self.telemetry_panel = TelemetryPanel(self)
+        self.addDockWidget(Qt.DockWidgetArea.BottomDockWidgetArea, self.telemetry_panel)
+        self.telemetry_panel.hide()
+        
+        telemetry_btn = QPushButton("📊")
+        telemetry_btn.setObjectName("telemetry_btn")
+        telemetry_btn.setFixedSize(28, 20)
+        telemetry_btn.setToolTip("Resource Monitor (Ctrl+Shift+M)")
+        telemetry_btn.clicked.connect(self.telemetry_panel.toggle)
+        self.statusBar().addPermanentWidget(telemetry_btn)
     
     def setup_shortcuts(self):
         """Setup global keyboard shortcuts"""
@@ -134,6 +217,10 @@ class MainWindow(QMainWindow):
         # Close tab: Ctrl+W (like browser close tab)
         close_tab_shortcut = QShortcut(QKeySequence("Ctrl+W"), self)
         close_tab_shortcut.activated.connect(self.close_current_tab)
+        
+        # Resource monitor: Ctrl+Shift+M
+        telemetry_shortcut = QShortcut(QKeySequence("Ctrl+Shift+M"), self)
+        telemetry_shortcut.activated.connect(self.telemetry_panel.toggle)
     
     def close_current_tab(self):
         """Close currently active tab"""
@@ -185,6 +272,31 @@ class MainWindow(QMainWindow):
             self.global_lock_btn.setEnabled(False)
             self.global_reload_btn.setEnabled(False)
     
+    def on_current_tab_changed(self, index):
+        """Build the web view of lazy/hibernated tabs and track foreground use"""
+        tab = self.get_active_tab_widget()
+        self.current_account_id = tab.account_id if tab else None
+        self.activity.focus_changed(self.current_account_id)
+        self.prewarmer.tab_switched(tab)
+        self.lifecycle.tab_switched(tab)
+        if tab:
+            self.recovery.reset(tab)
+            tab.set_lifecycle_state("active")
+            tab.activate()
+    
+    def update_memory_status(self, level, used, budget):
+        """Show renderer memory use against the budget in the status bar"""
+        used_mb = used // (1024 * 1024)
+        budget_mb = budget // (1024 * 1024)
+        icons = {LEVEL_NORMAL: "🟢", LEVEL_TRIM: "🟡", LEVEL_HIBERNATE: "🟠"}
+        self.memory_label.setText(f"{icons.get(level, '🔴')} Memory: {used_mb} MB / {budget_mb} MB")
+        
+        lines = [f"Level: {level}"]
+        for account_id, rss in sorted(self.memory_governor.samples.items(), key=lambda item: -item[1]):
+            if account_id in self.tabs:
+                lines.append(f"{self.tabs[account_id]['name']}: {rss // (1024 * 1024)} MB")
+        self.memory_label.setToolTip("\n".join(lines))
+    
     def zoom_in_active_tab(self):
         """Zoom in active tab"""
         tab = self.get_active_tab_widget()
@@ -300,9 +412,53 @@ class MainWindow(QMainWindow):
                 background-color: #2a3942;
                 color: #666;
             }
+            
+            /* Status bar (memory governor) */
+            QStatusBar {
+                background-color: #1f2c34;
+                color: #aaa;
+            }
+            #memory_label {
+                color: #aaa;
+                padding: 0px 8px;
+            }
+            #telemetry_btn {
+                background-color: transparent;
+                border: none;
+            }
+            #telemetry_btn:hover {
+                background-color: #2a3942;
+                border-radius: 4px;
+            }
+            
+            /* Resource monitor */
+            QDockWidget {
+                color: white;
+            }
+            QTableWidget {
+                background-color: #0b141a;
+                color: white;
+                gridline-color: #2a3942;
+            }
+            QHeaderView::section {
+                background-color: #1f2c34;
+                color: #aaa;
+                border: 0px;
+                padding: 4px;
+            }
         """)
     
     def add_account(self):
+        # Check memory budget before spawning another renderer
+        if not self.memory_governor.can_open_tab():
+            QMessageBox.warning(
+                self,
+                "Memory Budget Exceeded",
+                "Open accounts are using all of the available memory budget.\n\n"
+                "Close or hibernate some accounts before adding more."
+            )
+            return
+        
         # Check if too many accounts are already open
         max_accounts = 8  # Reasonable limit to prevent crashes
         if len(self.tabs) >= max_accounts:
@@ -336,7 +492,6 @@ class MainWindow(QMainWindow):
                     QCoreApplication.processEvents()
                 
                 if len(self.tabs) >= 2:
-                    import time
                     time.sleep(0.3)
                 
                 self.create_account_tab(account_id, name, session_dir)
@@ -363,48 +518,68 @@ class MainWindow(QMainWindow):
                     "Please try again or restart the application."
                 )
     
-    def create_account_tab(self, account_id, name, session_dir, zoom_level=1.0, password_hash=None):
+    @profiled
+    def create_account_tab(self, account_id, name, session_dir, zoom_level=1.0, password_hash=None, select=True):
         try:
             has_password = password_hash is not None
             
-            tab = WhatsAppTab(account_id, name, session_dir, zoom_level, has_password, self.db)
+            tab = WhatsAppTab(account_id, name, session_dir, zoom_level, has_password, self.db,
+                              lazy=config.LAZY_TABS, telemetry=self.telemetry,
+                              scheduler=self.load_scheduler, passwords=self.passwords,
+                              request_filter=self.request_filter)
+            self.telemetry.tab(account_id, name)
             
-            lock_icon = "🔒 " if has_password else ""
-            tab_title = f"{lock_icon}💬 {name}" if len(name) <= 10 else f"{lock_icon}💬 {name[:10]}..."
+            index = self.tab_widget.addTab(tab, self.format_tab_title(tab))
+            tab.state_changed.connect(lambda: self.refresh_tab_title(account_id))
+            tab.renderer_crashed.connect(lambda: self.recovery.on_crash(tab))
+            tab.reload_requested.connect(lambda: self.recovery.revive(tab))
+            tab.hibernated.connect(lambda: self.storage_monitor.compact(tab))
+            tab.hibernated.connect(lambda: self.prewarmer.tab_hibernated(tab))
+            tab.loaded.connect(lambda ok: self.prewarmer.tab_loaded(tab))
+            tab.unread_changed.connect(lambda count: self.unread_badges.changed(tab))
             
-            index = self.tab_widget.addTab(tab, tab_title)
+            if select:
+                self.tab_widget.setCurrentIndex(index)
             
-            self.tab_widget.setCurrentIndex(index)
-            
-            self.tabs[account_id] = {
-                "name": name,
-                "widget": tab,
-                "index": index
-            }
+            self.tabs.add(account_id, name, tab)
             
             self.update_window_title()
             self.update_global_controls()
-            self.update_tab_indices()
             
         except Exception as e:
             print(f"ERROR in create_account_tab: {e}")
             raise
     
-    def update_tab_indices(self):
-        """Update stored indices for all tabs"""
-        for account_id, info in self.tabs.items():
-            widget = info["widget"]
-            if widget is None:
-                continue
-                
-            current_index = self.tab_widget.indexOf(widget)
-            if current_index >= 0 and current_index != info["index"]:
-                info["index"] = current_index
+    def format_tab_title(self, tab):
+        """Tab text for an account: lock icon, state icon, short name and unread badge"""
+        lock_icon = "🔒 " if tab.has_password else ""
+        if tab.recovery_state == STATE_TRIPPED:
+            state_icon = "⚠️"
+        elif tab.recovery_state == STATE_RECOVERING:
+            state_icon = "🔄"
+        elif tab.is_hibernated:
+            state_icon = "💤"
+        elif tab.lifecycle_state != "active":
+            state_icon = "❄️"
+        else:
+            state_icon = "💬"
+        name = tab.name if len(tab.name) <= 10 else f"{tab.name[:10]}..."
+        badge = f" ({tab.unread})" if tab.unread else ""
+        return f"{lock_icon}{state_icon} {name}{badge}"
+    
+    def refresh_tab_title(self, account_id):
+        """Re-render the tab text of an account from its widget state"""
+        if account_id not in self.tabs:
+            return
+        index = self.tabs.index_of(account_id)
+        if index >= 0:
+            self.tab_widget.setTabText(index, self.format_tab_title(self.tabs[account_id]["widget"]))
     
     def on_tab_moved(self, from_index, to_index):
         """Called when user drags tabs"""
-        self.update_tab_indices()
+        self.tabs.moved(from_index, to_index)
     
+    @profiled
     def close_tab(self, index):
         try:
             # Prevent closing welcome tab
@@ -414,14 +589,7 @@ class MainWindow(QMainWindow):
             if index < 0 or index >= self.tab_widget.count():
                 return
             
-            # Find account_id for this tab index
-            account_id = None
-            current_widget = self.tab_widget.widget(index)
-            
-            for aid, info in self.tabs.items():
-                if info["widget"] == current_widget:
-                    account_id = aid
-                    break
+            account_id = self.tabs.account_at(index)
             
             if account_id is None:
                 return
@@ -441,25 +609,36 @@ class MainWindow(QMainWindow):
             )
             
             if reply == QMessageBox.StandardButton.Yes:
-                tab_widget = self.tabs[account_id]["widget"]
-                del self.tabs[account_id]
-                
-                self.db.delete_account(account_id)
+                # The strip may have changed while the dialog was open
+                index = self.tabs.index_of(account_id)
+                tab_widget = self.tabs.remove(account_id)["widget"]
+                self.telemetry.remove(account_id)
+                self.load_scheduler.cancel(tab_widget)
+                self.recovery.forget(account_id)
+                self.prewarmer.forget(account_id)
+                self.lifecycle.forget(account_id)
+                self.request_filter.forget(account_id)
+                self.unread_badges.forget(account_id)
                 
                 self.tab_widget.blockSignals(True)
                 self.tab_widget.removeTab(index)
                 self.tab_widget.blockSignals(False)
                 
+                # Tear the page down first so the profile lets go of its files;
+                # the session dir itself is purged in the background
                 tab_widget.cleanup()
+                self.db.delete_account(account_id)
                 
                 self.update_window_title()
                 
-                # Step 6: Update all remaining tab indices
-                self.update_tab_indices()
-                
-                # Step 7: Show welcome tab if no accounts left
+                # Show welcome tab if no accounts left
                 self.show_welcome_if_empty()
                 
+                # currentChanged was blocked above: activate whichever tab took
+                # over and move focus tracking off the removed account
+                self.on_current_tab_changed(self.tab_widget.currentIndex())
+                self.update_global_controls()
+                
                 print(f"Account removed successfully. Remaining accounts: {len(self.tabs)}")
         
         except Exception as e:
@@ -473,11 +652,22 @@ class MainWindow(QMainWindow):
             )
     
     def load_saved_accounts(self):
+        """Build the tab strip from account metadata; web views come after first paint"""
         accounts = self.db.get_all_accounts()
+        
+        # No currentChanged (and so no activation) while the strip is built
+        self.tab_widget.blockSignals(True)
         for account_id, name, session_dir, zoom_level, password_hash in accounts:
             # Use saved zoom level, default to 1.0 if None
             zoom = zoom_level if zoom_level else 1.0
-            self.create_account_tab(account_id, name, session_dir, zoom, password_hash)
+            self.create_account_tab(account_id, name, session_dir, zoom, password_hash, select=False)
+        
+        # Accounts come most recently used first; start on that one
+        if self.tabs:
+            self.tab_widget.setCurrentIndex(0)
+        self.tab_widget.blockSignals(False)
+        
+        self.update_global_controls()
         self.update_window_title()
     
     def show_welcome_if_empty(self):
@@ -555,12 +745,14 @@ class MainWindow(QMainWindow):
     
     def update_window_title(self):
         count = len(self.tabs)
+        unread = self.unread_badges.total
+        prefix = f"({unread}) " if unread else ""
         if count == 0:
             self.setWindowTitle("WhatsApp Manager")
         elif count == 1:
-            self.setWindowTitle("WhatsApp Manager - 1 account")
+            self.setWindowTitle(f"{prefix}WhatsApp Manager - 1 account")
         else:
-            self.setWindowTitle(f"WhatsApp Manager - {count} accounts")
+            self.setWindowTitle(f"{prefix}WhatsApp Manager - {count} accounts")
     
     def show_tab_context_menu(self, position):
         """Show right-click context menu on tab"""
@@ -575,13 +767,8 @@ class MainWindow(QMainWindow):
         if widget == self.welcome_tab:
             return
         
-        account_id = None
-        for aid, info in self.tabs.items():
-            if info["widget"] == widget:
-                account_id = aid
-                break
-        
-        if not account_id:
+        account_id = self.tabs.account_for(widget)
+        if account_id is None:
             return
         
         # Create context menu
@@ -607,6 +794,26 @@ class MainWindow(QMainWindow):
         
         menu.addSeparator()
         
+        # Keep the page running while hidden (no freezing) for real-time notifications
+        notifications_action = QAction("🔔 Needs Notifications", self)
+        notifications_action.setCheckable(True)
+        notifications_action.setChecked(self.lifecycle.needs_notifications(widget))
+        notifications_action.toggled.connect(lambda checked: self.lifecycle.set_needs_notifications(widget, checked))
+        menu.addAction(notifications_action)
+        
+        # Network requests this account does not need to make
+        filter_menu = menu.addMenu("🛡️ Request Filter")
+        enabled = self.request_filter.enabled(account_id)
+        for category, label in CATEGORIES.items():
+            category_action = QAction(label, self)
+            category_action.setCheckable(True)
+            category_action.setChecked(category in enabled)
+            category_action.toggled.connect(
+                lambda checked, category=category: self.request_filter.set_enabled(account_id, category, checked))
+            filter_menu.addAction(category_action)
+        
+        menu.addSeparator()
+        
         # Close tab
         close_action = QAction("❌ Close Tab", self)
         close_action.triggered.connect(lambda: self.close_tab(index))
@@ -637,19 +844,14 @@ class MainWindow(QMainWindow):
             
             # Update tabs dict
             self.tabs[account_id]["name"] = new_name
+            self.telemetry.tab(account_id, new_name)
             
             # Update tab widget
             widget = self.tabs[account_id]["widget"]
             widget.name = new_name
             
             # Update tab title
-            index = self.tabs[account_id]["index"]
-            current_title = self.tab_widget.tabText(index)
-            
-            # Preserve lock icon if exists
-            lock_icon = "🔒 " if current_title.startswith("🔒") else ""
-            tab_title = f"{lock_icon}💬 {new_name}" if len(new_name) <= 10 else f"{lock_icon}💬 {new_name[:10]}..."
-            self.tab_widget.setTabText(index, tab_title)
+            self.refresh_tab_title(account_id)
             
             print(f"Account renamed from '{old_name}' to '{new_name}'")
     
@@ -662,7 +864,7 @@ class MainWindow(QMainWindow):
         
         # Check if already has password
         if self.db.has_password(account_id):
-            # Verify old password first
+            # Verify old password first (on the password worker)
             old_password, ok = QInputDialog.getText(
                 self,
                 "Change Password",
@@ -673,13 +875,25 @@ class MainWindow(QMainWindow):
             if not ok:
                 return
             
-            if not self.db.verify_password(account_id, old_password):
-                QMessageBox.warning(
-                    self,
-                    "Wrong Password",
-                    "The current password you entered is incorrect."
-                )
-                return
+            self.passwords.verify(account_id, old_password, lambda ok: self.on_old_password_verified(account_id, ok))
+        else:
+            self.ask_new_password(account_id)
+    
+    def on_old_password_verified(self, account_id, ok):
+        if not ok:
+            QMessageBox.warning(
+                self,
+                "Wrong Password",
+                "The current password you entered is incorrect."
+            )
+            return
+        self.ask_new_password(account_id)
+    
+    def ask_new_password(self, account_id):
+        if account_id not in self.tabs:
+            return
+        
+        name = self.tabs[account_id]["name"]
         
         # Get new password
         password, ok = QInputDialog.getText(
@@ -712,33 +926,38 @@ class MainWindow(QMainWindow):
                 )
                 return
             
-            # Set password
-            self.db.set_password(account_id, password)
-            
-            # Update tab
-            widget = self.tabs[account_id]["widget"]
-            widget.has_password = True
-            widget.is_locked = True
-            widget.lock_tab()
-            
-            # Update global controls
-            self.update_global_controls()
-            
-            # Update tab title with lock icon
-            index = self.tabs[account_id]["index"]
-            current_title = self.tab_widget.tabText(index)
-            if not current_title.startswith("🔒"):
-                self.tab_widget.setTabText(index, "🔒 " + current_title)
-            
-            QMessageBox.information(
-                self,
-                "Password Set",
-                f"Password has been set for '{name}'.\nTab is now locked."
-            )
+            # Hash on the password worker, then store
+            self.passwords.hash(password, lambda password_hash: self.apply_tab_password(account_id, password_hash))
         else:
             # Remove password
             self.remove_tab_password(account_id)
     
+    def apply_tab_password(self, account_id, password_hash):
+        """Store a new password hash and lock the tab"""
+        if account_id not in self.tabs or not password_hash:
+            return
+        
+        name = self.tabs[account_id]["name"]
+        self.db.set_password_hash(account_id, password_hash)
+        
+        # Update tab
+        widget = self.tabs[account_id]["widget"]
+        widget.has_password = True
+        widget.is_locked = True
+        widget.lock_tab()
+        
+        # Update global controls
+        self.update_global_controls()
+        
+        # Update tab title with lock icon
+        self.refresh_tab_title(account_id)
+        
+        QMessageBox.information(
+            self,
+            "Password Set",
+            f"Password has been set for '{name}'.\nTab is now locked."
+        )
+    
     def remove_tab_password(self, account_id):
         """Remove password from tab"""
         if account_id not in self.tabs:
@@ -757,7 +976,7 @@ class MainWindow(QMainWindow):
         
         if reply == QMessageBox.StandardButton.Yes:
             # Remove password
-            self.db.set_password(account_id, None)
+            self.db.set_password_hash(account_id, None)
             
             # Update tab
             widget = self.tabs[account_id]["widget"]
@@ -772,10 +991,7 @@ class MainWindow(QMainWindow):
             self.update_global_controls()
             
             # Update tab title (remove lock icon)
-            index = self.tabs[account_id]["index"]
-            current_title = self.tab_widget.tabText(index)
-            if current_title.startswith("🔒 "):
-                self.tab_widget.setTabText(index, current_title.replace("🔒 ", ""))
+            self.refresh_tab_title(account_id)
             
             QMessageBox.information(
                 self,
@@ -0,0 +1,117 @@
+from PyQt6.QtCore import QObject, QTimer, pyqtSignal
+from core import config
+from core.memory import memory_budget, process_rss
+
+# Escalation levels, in order
+LEVEL_NORMAL = "normal"
+LEVEL_TRIM = "trim"            # discard pages of background tabs
+LEVEL_HIBERNATE = "hibernate"  # hibernate least recently used tabs
+LEVEL_REFUSE = "refuse"        # still over budget: refuse new tabs
+
+# Fraction of the budget at which background pages start being discarded
+TRIM_THRESHOLD = 0.8
+
+class MemoryGovernor(QObject):
+    """Samples renderer RSS of all tabs and escalates actions to stay within budget"""
+    
+    # level, used bytes, budget bytes
+    status_changed = pyqtSignal(str, int, int)
+    
+    def __init__(self, main_window):
+        super().__init__(main_window)
+        self.main_window = main_window
+        self.budget = memory_budget(config.MEMORY_BUDGET_MB)
+        self.level = LEVEL_NORMAL
+        self.usage = 0
+        self.samples = {}  # account_id -> renderer RSS in bytes
+        self.pids = {}     # account_id -> renderer PID (tabs may share one)
+        
+        self.timer = QTimer(self)
+        self.timer.timeout.connect(self.check)
+        if self.budget:
+            self.timer.start(config.MEMORY_SAMPLE_SECONDS * 1000)
+    
+    def sample(self):
+        """Measure RSS of every loaded tab's renderer, counting shared renderers once"""
+        samples = {}
+        pids = {}
+        rss_by_pid = {}
+        for account_id, info in self.main_window.tabs.items():
+            pid = info["widget"].renderer_pid()
+            if pid and pid not in rss_by_pid:
+                rss_by_pid[pid] = process_rss(pid)
+            rss = rss_by_pid.get(pid)
+            if rss:
+                samples[account_id] = rss
+                pids[account_id] = pid
+        self.samples = samples
+        self.pids = pids
+        self.usage = sum(rss for rss in rss_by_pid.values() if rss)
+        return self.usage
+    
+    def release(self, account_id):
+        """Bytes freed by tearing down a tab: its renderer, unless another tab still uses it"""
+        rss = self.samples.pop(account_id, 0)
+        pid = self.pids.pop(account_id, None)
+        return 0 if pid in self.pids.values() else rss
+    
+    def check(self):
+        if not self.budget:
+            return
+        
+        usage = self.sample()
+        level = LEVEL_NORMAL
+        
+        threshold = self.budget * TRIM_THRESHOLD
+        if usage >= threshold:
+            level = LEVEL_TRIM
+            # Once per rise past the threshold, not on every sample
+            if self.level == LEVEL_NORMAL:
+                usage = self.trim(usage, threshold)
+        
+        if usage > self.budget:
+            level = LEVEL_HIBERNATE
+            # "Needs notifications" accounts go last, only if nothing else is left
+            victims = self.main_window.hibernator.candidates(include_notifying=True)
+            while usage > self.budget and victims:
+                tab = victims.pop(0)
+                usage -= self.release(tab.account_id)
+                self.main_window.hibernator.hibernate(tab, "memory budget")
+            self.usage = usage
+            
+            if usage > self.budget:
+                level = LEVEL_REFUSE
+        
+        self.set_level(level)
+    
+    def trim(self, usage, threshold):
+        """Discard background pages, least recently used first, until below threshold"""
+        for tab in self.main_window.hibernator.candidates():
+            if usage < threshold:
+                break
+            if tab.lifecycle_state == "discarded":
+                continue
+            print(f"Discarding page of '{tab.name}' (memory pressure)")
+            tab.trim_memory()
+            usage -= self.release(tab.account_id)
+        self.usage = usage
+        return usage
+    
+    def set_level(self, level):
+        if level != self.level:
+            print(f"Memory governor: {self.level} -> {level} ({self.usage // (1024 * 1024)} MB used)")
+        self.level = level
+        self.status_changed.emit(level, self.usage, self.budget or 0)
+    
+    def has_headroom(self, tabs=1):
+        """True if `tabs` more renderers of average size fit below the trim threshold"""
+        if not self.budget:
+            return True
+        if self.level != LEVEL_NORMAL:
+            return False
+        average = self.usage / len(self.samples) if self.samples else 0
+        return self.usage + average * tabs <= self.budget * TRIM_THRESHOLD
+    
+    def can_open_tab(self):
+        """False while the budget is exhausted even after hibernating"""
+        return self.level != LEVEL_REFUSE
@@ -0,0 +1,28 @@
+from PyQt6.QtCore import QObject, pyqtSignal
+from core import passwords
+
+class PasswordService(QObject):
+    """Hashes and verifies passwords on a worker thread; callbacks run on the GUI thread"""
+    
+    # callback, result (emitted from the worker thread, delivered queued)
+    finished = pyqtSignal(object, object)
+    
+    def __init__(self, db, parent=None):
+        super().__init__(parent)
+        self.db = db
+        self.worker = passwords.PasswordWorker(self.finished.emit)
+        self.finished.connect(self.on_finished)
+    
+    def verify(self, account_id, password, callback):
+        """callback(ok) once the password was checked (and its hash upgraded if needed)"""
+        self.worker.submit(lambda: self.db.verify_password(account_id, password), callback)
+    
+    def hash(self, password, callback):
+        """callback(password_hash) with a fresh KDF hash"""
+        self.worker.submit(lambda: passwords.hash_password(password), callback)
+    
+    def on_finished(self, callback, result):
+        callback(result)
+    
+    def stop(self):
+        self.worker.stop()
@@ -0,0 +1,126 @@
+import time
+from PyQt6.QtCore import QObject, QTimer
+from core import config
+from core.memory import system_cpu_percent
+from core.switch_predictor import SwitchPredictor
+from gui.recovery import STATE_TRIPPED
+
+# Switch history older than this is not used for predictions
+HISTORY_DAYS = 30
+
+class Prewarmer(QObject):
+    """Loads the accounts most likely to be switched to next while the app is idle.
+    
+    Predictions come from past switches (SwitchPredictor, trained on the
+    focus_sessions history) and fall back to tab strip neighbours. Prewarming
+    stays within the memory governor's headroom. Hit rate and switch latency
+    are recorded in telemetry.
+    """
+    
+    def __init__(self, main_window):
+        super().__init__(main_window)
+        self.main_window = main_window
+        self.predictor = SwitchPredictor()
+        self.trained = False
+        # Switches from here on are recorded live; training only reads the
+        # history before this, so no switch is counted twice
+        self.started_at = time.time()
+        self.previous_id = None
+        self.prewarmed = {}  # account_id -> when it was loaded ahead of time (not visited yet)
+        self.pending_switch = None  # (account_id, started, prewarm hit) until the page is loaded
+        
+        self.idle_timer = QTimer(self)
+        self.idle_timer.setSingleShot(True)
+        self.idle_timer.setInterval(config.PREWARM_IDLE_SECONDS * 1000)
+        self.idle_timer.timeout.connect(self.prewarm)
+    
+    def tab_switched(self, tab):
+        """Called on every tab switch, before the tab is activated"""
+        account_id = tab.account_id if tab else None
+        self.predictor.record(self.previous_id, account_id)
+        self.previous_id = account_id
+        if tab is None:
+            return
+        
+        # Only a page that is still loaded counts as a hit
+        hit = self.prewarmed.pop(account_id, None) is not None and tab.web_view is not None \
+            and tab.lifecycle_state != "discarded"
+        started = time.perf_counter()
+        if tab.web_view is not None and tab.page_ready:
+            # Already loaded: only the repaint is left
+            QTimer.singleShot(0, lambda: self.switch_finished(started, hit))
+            self.pending_switch = None
+        else:
+            self.pending_switch = (account_id, started, hit)
+        
+        # Any switch restarts the idle countdown
+        self.restart_idle_timer()
+    
+    def restart_idle_timer(self):
+        # Starts a new CPU measurement window, read by is_idle() when the timer fires
+        system_cpu_percent()
+        self.idle_timer.start()
+    
+    def tab_hibernated(self, tab):
+        """A prewarmed tab that is torn down again was not a useful prewarm"""
+        self.prewarmed.pop(tab.account_id, None)
+    
+    def tab_loaded(self, tab):
+        if tab.page_ready and self.pending_switch and self.pending_switch[0] == tab.account_id:
+            _, started, hit = self.pending_switch
+            self.pending_switch = None
+            self.switch_finished(started, hit)
+    
+    def switch_finished(self, started, hit):
+        self.main_window.telemetry.switched(time.perf_counter() - started, hit)
+    
+    def is_idle(self):
+        """No page loads in flight and the host CPU was not busy during the idle period"""
+        scheduler = self.main_window.load_scheduler
+        if scheduler.pending or scheduler.active:
+            return False
+        cpu = system_cpu_percent()
+        return cpu is None or cpu < config.PREWARM_MAX_CPU_PERCENT
+    
+    def predictions(self):
+        if not self.trained:
+            self.trained = True
+            self.predictor.train(self.main_window.db.focus_sequence(
+                self.started_at - HISTORY_DAYS * 86400, until=self.started_at
+            ))
+        
+        order = self.main_window.tabs.ordered_ids()
+        return self.predictor.predict(self.main_window.current_account_id, order, config.PREWARM_TABS)
+    
+    def prewarm(self):
+        if not config.LAZY_TABS or config.PREWARM_TABS <= 0:
+            return
+        if not self.is_idle():
+            self.restart_idle_timer()
+            return
+        
+        governor = self.main_window.memory_governor
+        for account_id in self.predictions():
+            info = self.main_window.tabs.get(account_id)
+            if info is None:
+                continue
+            tab = info["widget"]
+            if tab.web_view or tab.is_locked or tab.recovery_state == STATE_TRIPPED:
+                continue
+            if not governor.has_headroom():
+                break
+            print(f"Prewarming '{tab.name}'")
+            tab.activate()
+            self.prewarmed[account_id] = time.monotonic()
+            self.main_window.telemetry.prewarmed()
+    
+    def recently_prewarmed(self, tab, seconds):
+        """True if tab was loaded ahead of time within the last `seconds` and not visited since"""
+        prewarmed = self.prewarmed.get(tab.account_id)
+        return prewarmed is not None and time.monotonic() - prewarmed < seconds
+    
+    def forget(self, account_id):
+        self.predictor.forget(account_id)
+        self.prewarmed.pop(account_id, None)
+        if self.pending_switch and self.pending_switch[0] == account_id:
+            self.pending_switch = None
@@ -0,0 +1,105 @@
+import os
+from PyQt6.QtCore import QTimer
+from PyQt6.QtWebEngineCore import QWebEngineProfile, QWebEngineScript, QWebEngineSettings
+from core.config import USER_SCRIPTS_DIR
+from core.storage_manager import profile_lock
+from core.user_scripts import load_bundle
+
+USER_AGENT = "Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/131.0.0.0 Safari/537.36"
+HTTP_CACHE_SIZE = 100 * 1024 * 1024
+
+_Attr = QWebEngineSettings.WebAttribute
+
+# Settings applied to every account profile, resolved once at import time
+SETTINGS_TEMPLATE = (
+    (_Attr.LocalStorageEnabled, True),
+    (_Attr.JavascriptEnabled, True),
+    (_Attr.JavascriptCanOpenWindows, True),
+    (_Attr.LocalContentCanAccessFileUrls, True),
+    (_Attr.AllowRunningInsecureContent, False),
+    (_Attr.PlaybackRequiresUserGesture, False),
+    (_Attr.AutoLoadImages, True),
+    (_Attr.PluginsEnabled, False),
+    (_Attr.PdfViewerEnabled, False),
+    (_Attr.AutoLoadIconsForPage, False),
+    (_Attr.TouchIconsEnabled, False),
+    (_Attr.WebGLEnabled, True),
+    (_Attr.Accelerated2dCanvasEnabled, True),
+    (_Attr.ErrorPageEnabled, True),
+)
+
+_INJECTION_POINTS = {
+    "document_creation": QWebEngineScript.InjectionPoint.DocumentCreation,
+    "document_ready": QWebEngineScript.InjectionPoint.DocumentReady,
+    "deferred": QWebEngineScript.InjectionPoint.Deferred,
+}
+_WORLDS = {
+    "main": QWebEngineScript.ScriptWorldId.MainWorld,
+    "application": QWebEngineScript.ScriptWorldId.ApplicationWorld,
+}
+
+def build_scripts(bundle):
+    """QWebEngineScripts for a user script bundle, named <script>@v<version>"""
+    scripts = []
+    for user_script in bundle.scripts:
+        script = QWebEngineScript()
+        script.setName(f"{user_script.name}@v{bundle.version}")
+        script.setSourceCode(user_script.source)
+        script.setInjectionPoint(_INJECTION_POINTS[user_script.injection_point])
+        script.setWorldId(_WORLDS[user_script.world])
+        script.setRunsOnSubFrames(user_script.subframes)
+        scripts.append(script)
+    return scripts
+
+class ProfileFactory:
+    """Builds one QWebEngineProfile per account and reuses it when the web view is recreated.
+    
+    Qt does not allow two live profiles with the same storage name, so this is a
+    process-wide registry (see the `profiles` instance below).
+    """
+    
+    def __init__(self):
+        self.profiles = {}
+        self._scripts = None  # built from the bundle on first use, shared by all profiles
+    
+    def profile_for(self, account_id, session_dir, cache_size=None):
+        """Get the account's profile, creating it on first use; cache_size overrides the default"""
+        profile = self.profiles.get(account_id)
+        if profile is None:
+            # Not while the storage thread is deleting this session's caches
+            with profile_lock:
+                profile = self.create(account_id, session_dir)
+                self.profiles[account_id] = profile
+        profile.setHttpCacheMaximumSize(cache_size or HTTP_CACHE_SIZE)
+        return profile
+    
+    def create(self, account_id, session_dir):
+        profile = QWebEngineProfile(f"profile_{account_id}", None)
+        profile.setPersistentStoragePath(session_dir)
+        profile.setCachePath(os.path.join(session_dir, "cache"))
+        profile.setHttpUserAgent(USER_AGENT)
+        
+        settings = profile.settings()
+        for attribute, value in SETTINGS_TEMPLATE:
+            settings.setAttribute(attribute, value)
+        
+        # Injected by Chromium into every document of the profile's pages,
+        # including reloads, so there is nothing left to do after a load
+        collection = profile.scripts()
+        for script in self.user_scripts():
+            collection.insert(script)
+        return profile
+    
+    def user_scripts(self):
+        if self._scripts is None:
+            self._scripts = build_scripts(load_bundle(USER_SCRIPTS_DIR))
+        return self._scripts
+    
+    def release(self, account_id, delay_ms=1000):
+        """Drop an account's profile once its pages are gone (account removed)"""
+        profile = self.profiles.pop(account_id, None)
+        if profile is not None:
+            # Pages are deleted with deleteLater; give them time to go first
+            QTimer.singleShot(delay_ms, profile.deleteLater)
+
+profiles = ProfileFactory()
@@ -0,0 +1,81 @@
+import time
+from collections import deque
+from PyQt6.QtCore import QObject, QTimer
+from core import config
+
+# Recovery states shown in the tab title
+STATE_RECOVERING = "recovering"  # reload scheduled after a crash
+STATE_TRIPPED = "tripped"        # too many crashes: hibernated until the user opens it
+
+BACKOFF_BASE_SECONDS = 2
+BACKOFF_MAX_SECONDS = 300
+
+class RecoverySupervisor(QObject):
+    """Reloads crashed renderers with exponential backoff and stops crash loops.
+    
+    Each crash within CRASH_WINDOW_MINUTES doubles the reload delay. Once an
+    account reaches CRASH_LIMIT crashes in that window the circuit trips: the
+    tab is hibernated and stays that way until the user activates it again.
+    """
+    
+    def __init__(self, main_window):
+        super().__init__(main_window)
+        self.main_window = main_window
+        self.history = {}  # account_id -> deque of crash times (monotonic)
+        self._tokens = {}
+    
+    def on_crash(self, tab):
+        now = time.monotonic()
+        window = config.CRASH_WINDOW_MINUTES * 60
+        crashes = self.history.setdefault(tab.account_id, deque())
+        crashes.append(now)
+        while crashes and now - crashes[0] > window:
+            crashes.popleft()
+        
+        if len(crashes) >= config.CRASH_LIMIT:
+            print(f"'{tab.name}' crashed {len(crashes)} times in {config.CRASH_WINDOW_MINUTES} min, hibernating")
+            self._tokens.pop(tab.account_id, None)
+            tab.hibernate()
+            self.set_state(tab, STATE_TRIPPED)
+            return
+        
+        delay = min(BACKOFF_BASE_SECONDS * 2 ** (len(crashes) - 1), BACKOFF_MAX_SECONDS)
+        token = object()
+        self._tokens[tab.account_id] = token
+        self.set_state(tab, STATE_RECOVERING)
+        print(f"'{tab.name}' renderer crashed, reloading in {delay}s")
+        QTimer.singleShot(int(delay * 1000), lambda: self.recover(tab.account_id, token))
+    
+    def recover(self, account_id, token):
+        if self._tokens.get(account_id) is not token:
+            return
+        del self._tokens[account_id]
+        
+        info = self.main_window.tabs.get(account_id)
+        if info is None:
+            return
+        tab = info["widget"]
+        self.set_state(tab, None)
+        tab.reload_whatsapp()
+    
+    def reset(self, tab):
+        """User opened a tripped tab: close the circuit and forget old crashes"""
+        # Switching to a tab that is only backing off must not clear its
+        # history, or a crash loop the user is watching would never trip
+        if tab.recovery_state == STATE_TRIPPED:
+            self.history.pop(tab.account_id, None)
+            self.set_state(tab, None)
+    
+    def revive(self, tab):
+        """Reload asked for on a hibernated tab (e.g. one that tripped while shown)"""
+        self.reset(tab)
+        tab.activate()
+    
+    def forget(self, account_id):
+        self.history.pop(account_id, None)
+        self._tokens.pop(account_id, None)
+    
+    def set_state(self, tab, state):
+        if tab.recovery_state != state:
+            tab.recovery_state = state
+            tab.state_changed.emit()
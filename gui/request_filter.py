@@ -0,0 +1,74 @@
+from PyQt6.QtCore import QObject
+from core import config
+from core.request_rules import RequestStats, RuleMatcher, parse_categories
+
+# Per-account setting: list of enabled rule categories (see core.request_rules)
+REQUEST_FILTER = "request_filter"
+
+class RequestFilter(QObject):
+    """Decides which network requests of each account are blocked or deferred.
+    
+    One interceptor is installed per account profile; all of them share the
+    compiled rules. "defer" rules only apply while the account's tab is not
+    the selected one. Counts of skipped requests are kept per account.
+    """
+    
+    def __init__(self, main_window):
+        super().__init__(main_window)
+        self.main_window = main_window
+        self.matcher = RuleMatcher()
+        self.default_categories = parse_categories(config.REQUEST_FILTER)
+        self.categories = {}  # account_id -> frozenset, read from the settings once
+        self.stats = {}       # account_id -> RequestStats
+        self.installed = set()
+    
+    def install(self, profile, account_id):
+        """Attach an interceptor to a newly created (or reused) account profile"""
+        if account_id in self.installed:
+            return
+        from gui.request_interceptor import RequestInterceptor
+        # Owned by the profile, so it lives exactly as long as the profile does
+        profile.setUrlRequestInterceptor(RequestInterceptor(self, account_id, profile))
+        self.installed.add(account_id)
+    
+    def enabled(self, account_id):
+        categories = self.categories.get(account_id)
+        if categories is None:
+            stored = self.main_window.db.get_setting(account_id, REQUEST_FILTER)
+            categories = self.default_categories if stored is None else parse_categories(",".join(stored))
+            self.categories[account_id] = categories
+        return categories
+    
+    def set_enabled(self, account_id, category, enabled):
+        categories = set(self.enabled(account_id))
+        if enabled:
+            categories.add(category)
+        else:
+            categories.discard(category)
+        self.categories[account_id] = frozenset(categories)
+        self.main_window.db.set_setting(account_id, REQUEST_FILTER, sorted(categories))
+    
+    def decide(self, account_id, host, path, resource_type):
+        """"block" (or "defer" for a hidden tab) if the request should not be made, else None"""
+        categories = self.enabled(account_id)
+        if not categories:
+            return None
+        rule = self.matcher.match(host, path, resource_type, categories)
+        if rule is None:
+            return None
+        if rule.action == "defer" and account_id == self.main_window.current_account_id:
+            return None
+        stats = self.stats.get(account_id)
+        if stats is None:
+            stats = self.stats[account_id] = RequestStats()
+        stats.record(rule.action, resource_type)
+        return rule.action
+    
+    def stats_for(self, account_id):
+        return self.stats.get(account_id) or RequestStats()
+    
+    def forget(self, account_id):
+        """The account was removed (its profile goes with it)"""
+        self.categories.pop(account_id, None)
+        self.stats.pop(account_id, None)
+        self.installed.discard(account_id)
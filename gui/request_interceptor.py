@@ -0,0 +1,21 @@
+from PyQt6.QtWebEngineCore import QWebEngineUrlRequestInfo, QWebEngineUrlRequestInterceptor
+
+# ResourceTypeImage -> "image", ResourceTypeXhr -> "xhr", ... (names used by the rules)
+RESOURCE_TYPES = {
+    member: member.name[len("ResourceType"):].lower()
+    for member in QWebEngineUrlRequestInfo.ResourceType
+}
+
+class RequestInterceptor(QWebEngineUrlRequestInterceptor):
+    """Profile-wide interceptor of one account; the decision is made by the RequestFilter"""
+    
+    def __init__(self, request_filter, account_id, parent=None):
+        super().__init__(parent)
+        self.request_filter = request_filter
+        self.account_id = account_id
+    
+    def interceptRequest(self, info):
+        url = info.requestUrl()
+        resource_type = RESOURCE_TYPES.get(info.resourceType(), "unknown")
+        if self.request_filter.decide(self.account_id, url.host(), url.path(), resource_type):
+            info.block(True)
@@ -0,0 +1,70 @@
+import sys
+from PyQt6.QtCore import QObject, QTimer, pyqtSignal
+from core import config
+from core.storage_manager import StorageManager
+
+class StorageMonitor(QObject):
+    """Periodically scans session dirs (off the GUI thread) and applies the disk budget"""
+    
+    # Emitted from the storage thread; delivered on the GUI thread
+    scanned = pyqtSignal(object)
+    
+    def __init__(self, main_window):
+        super().__init__(main_window)
+        self.main_window = main_window
+        self.manager = StorageManager(main_window.db, config.DISK_BUDGET_MB * 1024 * 1024, self.scanned.emit,
+                                      self.is_live)
+        self.scanned.connect(self.on_scanned)
+        
+        self.timer = QTimer(self)
+        self.timer.timeout.connect(self.scan)
+        self.timer.start(config.STORAGE_SCAN_MINUTES * 60 * 1000)
+        QTimer.singleShot(config.STORAGE_FIRST_SCAN_SECONDS * 1000, self.scan)
+        
+        self.compact_timer = QTimer(self)
+        self.compact_timer.setSingleShot(True)
+        self.compact_timer.setInterval(5000)
+        self.compact_timer.timeout.connect(self.scan)
+    
+    def is_live(self, account_id):
+        """Whether the account's WebEngine profile exists (asked from the storage thread)"""
+        # No factory loaded means WebEngine was never imported: no profiles
+        profile_factory = sys.modules.get("gui.profile_factory")
+        return profile_factory is not None and account_id in profile_factory.profiles.profiles
+    
+    def scan(self):
+        self.manager.request_scan()
+    
+    def compact(self, tab):
+        """A tab was hibernated: rescan soon so its cache counts as cold"""
+        # Several tabs are often hibernated together; one scan covers them all
+        self.compact_timer.start()
+    
+    def on_scanned(self, result):
+        telemetry = self.main_window.telemetry
+        for account_id, usage in result.usage.items():
+            if account_id in self.main_window.tabs:
+                metrics = telemetry.tab(account_id)
+                metrics.disk_bytes = usage.total_bytes
+                metrics.cache_bytes = usage.cache_bytes
+        
+        for account_id in result.cleared:
+            print(f"Cleared caches of account {account_id} (disk budget)")
+        
+        # Over budget with a live profile: clear through Qt, but only for tabs
+        # that are not showing a page (hibernated, or not built yet). Live
+        # profiles only exist once WebEngine has been imported; never import it here
+        if not result.needs_clear:
+            return
+        profile_factory = sys.modules.get("gui.profile_factory")
+        if profile_factory is None:
+            return
+        for account_id in result.needs_clear:
+            info = self.main_window.tabs.get(account_id)
+            profile = profile_factory.profiles.profiles.get(account_id)
+            if info and profile is not None and info["widget"].web_view is None:
+                print(f"Clearing HTTP cache of '{info['name']}' (disk budget)")
+                profile.clearHttpCache()
+    
+    def stop(self):
+        self.manager.stop()
@@ -0,0 +1,72 @@
+import calendar
+import time
+from PyQt6.QtCore import QObject, QTimer
+from core import config
+
+def idle_seconds(last_active):
+    """Seconds since a last_active timestamp (UTC, SQLite format)"""
+    if not last_active:
+        return float("inf")
+    try:
+        then = calendar.timegm(time.strptime(last_active, "%Y-%m-%d %H:%M:%S"))
+    except ValueError:
+        return float("inf")
+    return max(0, time.time() - then)
+
+class TabHibernator(QObject):
+    """Hibernates background tabs that have been idle for too long"""
+    
+    def __init__(self, main_window):
+        super().__init__(main_window)
+        self.main_window = main_window
+        self.db = main_window.db
+        
+        self.timer = QTimer(self)
+        self.timer.timeout.connect(self.check)
+        self.timer.start(config.HIBERNATE_CHECK_SECONDS * 1000)
+    
+    def last_active(self, tab):
+        account = self.db.get_account(tab.account_id)
+        return account.last_active if account else None
+    
+    def loaded_tabs(self):
+        return [info["widget"] for info in self.main_window.tabs.values() if info["widget"].web_view]
+    
+    def candidates(self, include_notifying=False):
+        """Loaded background tabs, least recently used first.
+        
+        Accounts marked "needs notifications" are left out, or with
+        include_notifying put last (memory pressure only).
+        """
+        current = self.main_window.get_active_tab_widget()
+        needs_notifications = self.main_window.lifecycle.needs_notifications
+        tabs = []
+        for tab in self.loaded_tabs():
+            if tab is current:
+                continue
+            notifying = needs_notifications(tab)
+            if notifying and not include_notifying:
+                continue
+            tabs.append((notifying, self.last_active(tab) or "", tab))
+        tabs.sort(key=lambda item: item[:2])
+        return [tab for _, _, tab in tabs]
+    
+    def check(self):
+        if config.HIBERNATE_IDLE_MINUTES <= 0:
+            return
+        
+        idle_limit = config.HIBERNATE_IDLE_MINUTES * 60
+        for tab in self.candidates():
+            # A prewarmed tab gets the full idle period before it counts as unused
+            if self.main_window.prewarmer.recently_prewarmed(tab, idle_limit):
+                continue
+            if idle_seconds(self.last_active(tab)) >= idle_limit:
+                self.hibernate(tab, "idle")
+    
+    def hibernate(self, tab, reason):
+        print(f"Hibernating '{tab.name}' ({reason})")
+        tab.hibernate()
+        if self.main_window.lifecycle.needs_notifications(tab):
+            # The user asked for this account to stay live; say why it is not
+            self.main_window.statusBar().showMessage(
+                f"💤 '{tab.name}' was hibernated ({reason}); notifications resume when you open it", 15000)
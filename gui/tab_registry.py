@@ -0,0 +1,89 @@
+class TabRegistry:
+    """Account tabs of the main window, indexed both ways.
+    
+    Behaves like the old `{account_id: {"name", "widget"}}` dict, plus an
+    O(1) widget -> account_id lookup. Tab positions are not kept up to date
+    (every insert, move or close would shift them); they are derived from
+    the tab widget on demand and cached. A stale cached position is first
+    looked for one slot either side, which is where a drag or a close
+    leaves the other tabs, before the cache is rebuilt.
+    """
+    
+    def __init__(self, tab_widget):
+        self.tab_widget = tab_widget
+        self._by_account = {}   # account_id -> {"name", "widget"}
+        self._by_widget = {}    # widget -> account_id
+        self._positions = None  # widget -> index, rebuilt lazily
+    
+    def add(self, account_id, name, widget):
+        self._by_account[account_id] = {"name": name, "widget": widget}
+        self._by_widget[widget] = account_id
+    
+    def remove(self, account_id):
+        info = self._by_account.pop(account_id, None)
+        if info is not None:
+            self._by_widget.pop(info["widget"], None)
+            if self._positions is not None:
+                self._positions.pop(info["widget"], None)
+        return info
+    
+    def account_for(self, widget):
+        """account_id shown by a tab widget, or None (welcome tab, unknown widget)"""
+        return self._by_widget.get(widget)
+    
+    def account_at(self, index):
+        return self._by_widget.get(self.tab_widget.widget(index))
+    
+    def widget(self, account_id):
+        info = self._by_account.get(account_id)
+        return info["widget"] if info else None
+    
+    def index_of(self, account_id):
+        """Current tab position of an account (-1 if it has no tab)"""
+        widget = self.widget(account_id)
+        if widget is None:
+            return -1
+        if self._positions is not None and widget in self._positions:
+            cached = self._positions[widget]
+            for index in (cached, cached - 1, cached + 1):
+                if self.tab_widget.widget(index) is widget:
+                    self._positions[widget] = index
+                    return index
+        self._positions = {self.tab_widget.widget(index): index for index in range(self.tab_widget.count())}
+        return self._positions.get(widget, -1)
+    
+    def moved(self, from_index, to_index):
+        """A tab was dragged; only its own position jumps, the rest shift by one"""
+        if self._positions is not None:
+            self._positions[self.tab_widget.widget(to_index)] = to_index
+    
+    def ordered_ids(self):
+        """Account ids in tab strip order"""
+        ids = []
+        for index in range(self.tab_widget.count()):
+            account_id = self._by_widget.get(self.tab_widget.widget(index))
+            if account_id is not None:
+                ids.append(account_id)
+        return ids
+    
+    # Mapping interface used throughout the GUI
+    def __getitem__(self, account_id):
+        return self._by_account[account_id]
+    
+    def get(self, account_id, default=None):
+        return self._by_account.get(account_id, default)
+    
+    def __contains__(self, account_id):
+        return account_id in self._by_account
+    
+    def __iter__(self):
+        return iter(self._by_account)
+    
+    def __len__(self):
+        return len(self._by_account)
+    
+    def items(self):
+        return self._by_account.items()
+    
+    def values(self):
+        return self._by_account.values()
@@ -0,0 +1,123 @@
+from PyQt6.QtWidgets import (QDockWidget, QWidget, QVBoxLayout, QHBoxLayout, QPushButton,
+                              QTableWidget, QTableWidgetItem, QHeaderView, QMessageBox, QLabel)
+from PyQt6.QtCore import Qt, QTimer
+from core import config
+from core.memory import process_rss, process_cpu_percent, forget_cpu_samples
+
+COLUMNS = ("Account", "PID", "Memory (MB)", "CPU %", "Loads", "Last load (s)", "TTI (s)", "Crashes", "Disk (MB)", "Blocked", "Saved (MB)")
+
+class TelemetryPanel(QDockWidget):
+    """Dockable per-tab resource monitor with JSON / Prometheus export"""
+    
+    def __init__(self, main_window):
+        super().__init__("📊 Resource Monitor", main_window)
+        self.main_window = main_window
+        self.telemetry = main_window.telemetry
+        self.setObjectName("telemetry_panel")
+        self.setAllowedAreas(Qt.DockWidgetArea.BottomDockWidgetArea | Qt.DockWidgetArea.RightDockWidgetArea)
+        
+        container = QWidget()
+        layout = QVBoxLayout(container)
+        layout.setContentsMargins(5, 5, 5, 5)
+        
+        self.table = QTableWidget(0, len(COLUMNS))
+        self.table.setHorizontalHeaderLabels(COLUMNS)
+        self.table.horizontalHeader().setSectionResizeMode(QHeaderView.ResizeMode.Stretch)
+        self.table.verticalHeader().setVisible(False)
+        self.table.setEditTriggers(QTableWidget.EditTrigger.NoEditTriggers)
+        self.table.setSortingEnabled(True)
+        layout.addWidget(self.table)
+        
+        buttons = QHBoxLayout()
+        self.switch_label = QLabel()
+        buttons.addWidget(self.switch_label)
+        self.loop_label = QLabel()
+        buttons.addWidget(self.loop_label)
+        buttons.addStretch()
+        export_btn = QPushButton("💾 Export metrics")
+        export_btn.clicked.connect(self.export_with_feedback)
+        buttons.addWidget(export_btn)
+        layout.addLayout(buttons)
+        
+        self.setWidget(container)
+        
+        # Sample even while hidden so exported metrics stay current
+        self.timer = QTimer(self)
+        self.timer.timeout.connect(self.refresh)
+        self.timer.start(config.TELEMETRY_SAMPLE_SECONDS * 1000)
+    
+    def sample(self):
+        """Read renderer PID, RSS and CPU of every tab"""
+        pids = []
+        for account_id, info in self.main_window.tabs.items():
+            pid = info["widget"].renderer_pid()
+            pids.append(pid)
+            self.telemetry.tab(account_id, info["name"])
+            self.telemetry.update_process(account_id, pid, process_rss(pid), process_cpu_percent(pid))
+            self.telemetry.update_requests(account_id, self.main_window.request_filter.stats_for(account_id))
+        forget_cpu_samples(pids)
+    
+    def refresh(self):
+        self.sample()
+        if not self.isVisible():
+            return
+        
+        rows = list(self.telemetry.tabs.values())
+        self.table.setSortingEnabled(False)
+        self.table.setRowCount(len(rows))
+        for row, metrics in enumerate(rows):
+            last_load = metrics.last_load_seconds
+            tti = metrics.time_to_interactive
+            values = (
+                metrics.name,
+                metrics.renderer_pid or "-",
+                round(metrics.rss_bytes / (1024 * 1024)),
+                round(metrics.cpu_percent, 1),
+                metrics.load_count,
+                round(last_load, 2) if last_load is not None else "-",
+                round(tti, 2) if tti is not None else "-",
+                metrics.crash_count,
+                round(metrics.disk_bytes / (1024 * 1024)),
+                metrics.blocked_requests + metrics.deferred_requests,
+                round(metrics.saved_bytes / (1024 * 1024), 1),
+            )
+            for column, value in enumerate(values):
+                item = QTableWidgetItem()
+                item.setData(Qt.ItemDataRole.DisplayRole, value)
+                self.table.setItem(row, column, item)
+        self.table.setSortingEnabled(True)
+        
+        stats = self.telemetry.switch_stats()
+        hit_rate = f"{stats['hit_rate']:.0%}" if stats['hit_rate'] is not None else "-"
+        p50 = f"{stats['latency_p50'] * 1000:.0f} ms" if stats['latency_p50'] is not None else "-"
+        p95 = f"{stats['latency_p95'] * 1000:.0f} ms" if stats['latency_p95'] is not None else "-"
+        self.switch_label.setText(
+            f"Switches: {stats['switches']} | Prewarm hits: {stats['prewarm_hits']}/{stats['prewarms']} ({hit_rate}) | "
+            f"Switch latency p50 {p50}, p95 {p95} | "
+            f"Filtered: {sum(m.blocked_requests + m.deferred_requests for m in rows)} requests, "
+            f"~{sum(m.saved_bytes for m in rows) / (1024 * 1024):.1f} MB saved"
+        )
+        
+        loop = self.telemetry.loop_stats()
+        loop_p95 = f"{loop['latency_p95'] * 1000:.0f} ms" if loop['latency_p95'] is not None else "-"
+        self.loop_label.setText(f"Event loop p95 {loop_p95} | Stalls: {loop['stalls']} ({loop['stall_seconds']:.1f}s)")
+    
+    def export(self):
+        """Write metrics.json and metrics.prom to the metrics directory"""
+        self.sample()
+        metrics_dir = self.main_window.db.app_data_dir / "metrics"
+        self.telemetry.export_json(metrics_dir / "metrics.json")
+        self.telemetry.export_prometheus(metrics_dir / "metrics.prom")
+        return metrics_dir
+    
+    def export_with_feedback(self):
+        try:
+            metrics_dir = self.export()
+            QMessageBox.information(self, "Metrics Exported", f"Metrics written to:\n{metrics_dir}")
+        except OSError as e:
+            QMessageBox.warning(self, "Export Failed", f"Could not write metrics:\n{e}")
+    
+    def toggle(self):
+        self.setVisible(not self.isVisible())
+        if self.isVisible():
+            self.refresh()
@@ -0,0 +1,48 @@
+from PyQt6.QtCore import QObject, QTimer
+from core import config
+
+class UnreadBadges(QObject):
+    """Collects unread counts of all tabs into tab badges and a window-title total.
+    
+    Tabs report changes as they happen (page title events); the tab bar and
+    window title are updated at most once per UNREAD_DEBOUNCE_MS, and only
+    for the tabs whose count actually changed since the last update.
+    """
+    
+    def __init__(self, main_window):
+        super().__init__(main_window)
+        self.main_window = main_window
+        self.counts = {}   # account_id -> unread count shown right now
+        self.total = 0
+        self.dirty = set()
+        
+        # Not restarted by further changes, so a busy account cannot hold it off
+        self.timer = QTimer(self)
+        self.timer.setSingleShot(True)
+        self.timer.setInterval(config.UNREAD_DEBOUNCE_MS)
+        self.timer.timeout.connect(self.flush)
+    
+    def changed(self, tab):
+        """A tab's unread count changed (WhatsAppTab.unread_changed)"""
+        self.dirty.add(tab.account_id)
+        if not self.timer.isActive():
+            self.timer.start()
+    
+    def flush(self):
+        dirty, self.dirty = self.dirty, set()
+        total_before = self.total
+        for account_id in dirty:
+            info = self.main_window.tabs.get(account_id)
+            count = info["widget"].unread if info else 0
+            if count == self.counts.get(account_id, 0):
+                continue
+            self.total += count - self.counts.get(account_id, 0)
+            self.counts[account_id] = count
+            self.main_window.refresh_tab_title(account_id)
+        if self.total != total_before:
+            self.main_window.update_window_title()
+    
+    def forget(self, account_id):
+        """The account's tab was closed"""
+        self.total -= self.counts.pop(account_id, 0)
+        self.dirty.discard(account_id)
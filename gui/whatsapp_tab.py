@@ -1,12 +1,27 @@
+import sys
 from PyQt6.QtWidgets import QWidget, QVBoxLayout, QHBoxLayout, QPushButton, QLabel, QLineEdit, QInputDialog, QMessageBox, QGraphicsBlurEffect
-from PyQt6.QtCore import QUrl, Qt, QTimer
-from PyQt6.QtWebEngineWidgets import QWebEngineView
-from PyQt6.QtWebEngineCore import QWebEngineProfile, QWebEnginePage, QWebEngineSettings
+from PyQt6.QtCore import QUrl, Qt, QTimer, pyqtSignal
 from PyQt6.QtGui import QKeySequence, QShortcut
-import os
+from core import config
+from core.startup_timeline import timeline
+from core.profiling import profiled
+from core.unread import unread_count
 
 class WhatsAppTab(QWidget):
-    def __init__(self, account_id, name, session_dir, zoom_level=1.0, has_password=False, db=None):
+    # Emitted when something shown in the tab title changes (e.g. hibernation)
+    state_changed = pyqtSignal()
+    # Emitted when the renderer terminated abnormally (crash, OOM kill)
+    renderer_crashed = pyqtSignal()
+    # Emitted after the web view was torn down by hibernate()
+    hibernated = pyqtSignal()
+    # Emitted when a page load finished (ok)
+    loaded = pyqtSignal(bool)
+    # Emitted when the number of unread chats shown by the page changes
+    unread_changed = pyqtSignal(int)
+    # Emitted when the user asks to reload a tab that has no page (hibernated)
+    reload_requested = pyqtSignal()
+    
+    def __init__(self, account_id, name, session_dir, zoom_level=1.0, has_password=False, db=None, lazy=False, telemetry=None, scheduler=None, passwords=None, request_filter=None):
         super().__init__()
         self.account_id = account_id
         self.name = name
@@ -15,18 +30,31 @@ class WhatsAppTab(QWidget):
         self.has_password = has_password
         self.is_locked = has_password  # Lock by default if password set
         self.db = db
+        self.lazy = lazy  # Defer WebEngine until the tab is activated
+        self.telemetry = telemetry
+        self.scheduler = scheduler
+        self.passwords = passwords  # PasswordService: KDF work off the GUI thread
+        self.request_filter = request_filter
+        self.verifying = False
         self.profile = None
+        self.cache_size = None  # HTTP cache limit, set by the cache tuner
         self.is_loading = False
+        self.page_ready = False  # WhatsApp Web has finished loading in the current web view
+        self.lifecycle_state = "active"  # page lifecycle: active, frozen or discarded
+        self.unread = 0  # unread chats, from the page title; kept while hibernated
         self.web_view = None
         self.lock_screen = None
+        self.placeholder = None
+        self.is_hibernated = False
+        self.recovery_state = None  # Set by the recovery supervisor
         
         try:
             self.setup_ui()
             self.setup_shortcuts()
             
             if not self.is_locked and self.web_view:
-                QTimer.singleShot(200, self.load_whatsapp)
-                
+                self.request_load(200)
+        
         except Exception as e:
             print(f"ERROR initializing tab {name}: {e}")
             raise
@@ -38,15 +66,129 @@ class WhatsAppTab(QWidget):
         
         self.web_view = None
         self.lock_screen = None
+        self.placeholder = None
         
         if self.is_locked:
             self.show_lock_screen()
+        elif self.lazy:
+            self.show_placeholder()
         else:
             self.create_webview()
             if self.web_view:
                 layout.addWidget(self.web_view)
                 self.apply_zoom()
     
+    def show_placeholder(self):
+        """Lightweight stand-in shown until the web view is built"""
+        if self.placeholder:
+            return
+        
+        icon = "💤" if self.is_hibernated else "💬"
+        self.placeholder = QWidget()
+        self.placeholder.setStyleSheet("background-color: #0b141a;")
+        placeholder_layout = QVBoxLayout(self.placeholder)
+        placeholder_layout.addStretch()
+        
+        label = QLabel(f"{icon}\n\n{self.name}")
+        label.setAlignment(Qt.AlignmentFlag.AlignCenter)
+        label.setStyleSheet("font-size: 20px; color: #aaa;")
+        placeholder_layout.addWidget(label)
+        
+        if self.is_hibernated:
+            # The only way back for a tab that is already the current one
+            reload_btn = QPushButton("🔄 Reload")
+            reload_btn.setFixedWidth(120)
+            reload_btn.setStyleSheet("""
+                QPushButton {
+                    background-color: #00a884;
+                    color: white;
+                    border: none;
+                    border-radius: 6px;
+                    padding: 8px;
+                    font-size: 13px;
+                }
+                QPushButton:hover {
+                    background-color: #06cf9c;
+                }
+            """)
+            reload_btn.clicked.connect(self.reload_requested.emit)
+            placeholder_layout.addWidget(reload_btn, alignment=Qt.AlignmentFlag.AlignCenter)
+        
+        placeholder_layout.addStretch()
+        self.layout().addWidget(self.placeholder)
+    
+    def activate(self):
+        """Build and load the web view if it does not exist yet (lazy tabs)"""
+        if self.web_view or self.is_locked:
+            return
+        
+        self.create_webview()
+        
+        if self.web_view:
+            if self.placeholder:
+                self.placeholder.hide()
+                self.placeholder.deleteLater()
+                self.placeholder = None
+            self.layout().addWidget(self.web_view)
+            self.apply_zoom()
+            self.request_load(100)
+            
+            if self.is_hibernated:
+                self.is_hibernated = False
+                self.state_changed.emit()
+    
+    def hibernate(self):
+        """Tear down the web view to free its renderer; activate() restores it"""
+        if not self.web_view:
+            return
+        
+        self.cleanup(release_profile=False)
+        if self.scheduler:
+            self.scheduler.cancel(self)
+        self.is_loading = False
+        self.is_hibernated = True
+        self.show_placeholder()
+        if self.lock_screen and self.lock_screen.isVisible():
+            self.lock_screen.raise_()
+        self.state_changed.emit()
+        self.hibernated.emit()
+    
+    def trim_memory(self):
+        """Free renderer memory of a background tab: discard its page (or freeze it
+        if Chromium advises against discarding); the page reloads when shown"""
+        if not self.web_view or not self.web_view.page():
+            return
+        recommended = self.web_view.page().recommendedState().name.lower()
+        if recommended != "active":
+            self.set_lifecycle_state(recommended)
+    
+    def set_lifecycle_state(self, name):
+        """Put the page into the "active", "frozen" or "discarded" lifecycle state"""
+        if not self.web_view or not self.web_view.page():
+            return
+        from PyQt6.QtWebEngineCore import QWebEnginePage
+        state = getattr(QWebEnginePage.LifecycleState, name.capitalize())
+        page = self.web_view.page()
+        # Visible pages are always active; Qt refuses anything else
+        if page.lifecycleState() != state and (state == QWebEnginePage.LifecycleState.Active or not page.isVisible()):
+            page.setLifecycleState(state)
+    
+    def on_lifecycle_state_changed(self, state):
+        self.lifecycle_state = state.name.lower()
+        self.state_changed.emit()
+    
+    def on_title_changed(self, title):
+        count = unread_count(title)
+        if count != self.unread:
+            self.unread = count
+            self.unread_changed.emit(count)
+    
+    def renderer_pid(self):
+        """PID of the renderer process backing this tab (0 if none)"""
+        if self.web_view and self.web_view.page():
+            return self.web_view.page().renderProcessPid()
+        return 0
+    
     def setup_shortcuts(self):
         """Setup keyboard shortcuts"""
         QShortcut(QKeySequence("Ctrl++"), self).activated.connect(self.zoom_in)
@@ -56,63 +198,63 @@ class WhatsAppTab(QWidget):
         QShortcut(QKeySequence("F5"), self).activated.connect(self.reload_whatsapp)
         QShortcut(QKeySequence("Ctrl+R"), self).activated.connect(self.reload_whatsapp)
     
+    @profiled
     def create_webview(self):
+        # WebEngine is imported on first use so the window can show without it.
+        # A failure here (missing module, QApplication created without the
+        # attributes from main.create_application) breaks every tab, so it is
+        # raised instead of being handled as a problem with this account.
         try:
-            if self.profile:
-                self.profile.deleteLater()
-                self.profile = None
-            
-            import gc, time
-            gc.collect()
-            
-            profile_name = f"profile_{self.account_id}_{int(time.time() * 1000)}"
-            self.profile = QWebEngineProfile(profile_name, None)
-            self.profile.setPersistentStoragePath(self.session_dir)
-            self.profile.setCachePath(os.path.join(self.session_dir, "cache"))
-            self.profile.setHttpCacheMaximumSize(100 * 1024 * 1024)
-            
-            user_agent = "Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/131.0.0.0 Safari/537.36"
-            self.profile.setHttpUserAgent(user_agent)
-            
-            settings = self.profile.settings()
-            settings.setAttribute(QWebEngineSettings.WebAttribute.LocalStorageEnabled, True)
-            settings.setAttribute(QWebEngineSettings.WebAttribute.JavascriptEnabled, True)
-            settings.setAttribute(QWebEngineSettings.WebAttribute.JavascriptCanOpenWindows, True)
-            settings.setAttribute(QWebEngineSettings.WebAttribute.LocalContentCanAccessFileUrls, True)
-            settings.setAttribute(QWebEngineSettings.WebAttribute.AllowRunningInsecureContent, False)
-            settings.setAttribute(QWebEngineSettings.WebAttribute.PlaybackRequiresUserGesture, False)
-            settings.setAttribute(QWebEngineSettings.WebAttribute.AutoLoadImages, True)
-            settings.setAttribute(QWebEngineSettings.WebAttribute.PluginsEnabled, False)
-            settings.setAttribute(QWebEngineSettings.WebAttribute.PdfViewerEnabled, False)
-            settings.setAttribute(QWebEngineSettings.WebAttribute.AutoLoadIconsForPage, False)
-            settings.setAttribute(QWebEngineSettings.WebAttribute.TouchIconsEnabled, False)
-            settings.setAttribute(QWebEngineSettings.WebAttribute.WebGLEnabled, True)
-            settings.setAttribute(QWebEngineSettings.WebAttribute.Accelerated2dCanvasEnabled, True)
-            settings.setAttribute(QWebEngineSettings.WebAttribute.ErrorPageEnabled, True)
+            from PyQt6.QtWebEngineWidgets import QWebEngineView
+            from PyQt6.QtWebEngineCore import QWebEnginePage
+            from gui import profile_factory
+        except (ImportError, RuntimeError) as e:
+            print(f"FATAL: QtWebEngine could not be loaded: {e}")
+            raise
+        timeline.mark("webengine_import")
+        
+        try:
+            # Reused across hibernation/recreation; built from a settings template
+            self.profile = profile_factory.profiles.profile_for(self.account_id, self.session_dir, self.cache_size)
+            if self.request_filter:
+                self.request_filter.install(self.profile, self.account_id)
             
             page = QWebEnginePage(self.profile, self)
+            page.loadStarted.connect(self.on_load_started)
             page.loadFinished.connect(self.on_page_loaded)
             page.renderProcessTerminated.connect(self.on_render_process_terminated)
+            page.lifecycleStateChanged.connect(self.on_lifecycle_state_changed)
+            # WhatsApp Web announces unread chats in the title and swaps the
+            # favicon; both arrive as events, so nothing has to be polled
+            page.titleChanged.connect(self.on_title_changed)
+            page.iconUrlChanged.connect(lambda url: self.on_title_changed(page.title()))
             
             self.web_view = QWebEngineView(self)
             self.web_view.setPage(page)
-            
-            from PyQt6.QtCore import QCoreApplication
-            QCoreApplication.processEvents()
-            
+        
         except Exception as e:
             print(f"ERROR creating webview for {self.name}: {e}")
             self.web_view = None
     
+    def request_load(self, delay_ms):
+        """Load WhatsApp Web through the load scheduler (or after a delay without one)"""
+        if self.scheduler:
+            self.scheduler.request(self)
+        else:
+            QTimer.singleShot(delay_ms, self.load_whatsapp)
+    
+    def on_load_started(self):
+        if self.telemetry:
+            self.telemetry.load_started(self.account_id)
+    
     def on_page_loaded(self, ok):
         """Called when page finishes loading"""
-        if ok and self.web_view:
-            js_script = """
-            Object.defineProperty(navigator, 'webdriver', {
-                get: () => undefined
-            });
-            """
-            self.web_view.page().runJavaScript(js_script)
+        if self.telemetry:
+            self.telemetry.load_finished(self.account_id, ok)
+        if self.scheduler:
+            self.scheduler.load_finished(self, ok)
+        self.page_ready = ok and self.web_view is not None
+        self.loaded.emit(ok)
     
     def on_render_process_terminated(self, terminationStatus, exitCode):
         """Called when render process crashes"""
@@ -126,8 +268,13 @@ class WhatsAppTab(QWidget):
         }
         status_name = status_names.get(terminationStatus, "Unknown")
         
+        if self.telemetry and terminationStatus != QWebEnginePage.RenderProcessTerminationStatus.NormalTerminationStatus:
+            self.telemetry.crashed(self.account_id)
+        
         if terminationStatus != QWebEnginePage.RenderProcessTerminationStatus.NormalTerminationStatus:
-            QTimer.singleShot(2000, self.reload_whatsapp)
+            # Reload (with backoff) is decided by the recovery supervisor
+            print(f"Renderer of '{self.name}' terminated: {status_name} (exit code {exitCode})")
+            self.renderer_crashed.emit()
         else:
             QMessageBox.warning(
                 self,
@@ -142,7 +289,7 @@ class WhatsAppTab(QWidget):
         if self.web_view and not self.is_loading:
             try:
                 self.is_loading = True
-                self.web_view.setUrl(QUrl("https://web.whatsapp.com"))
+                self.web_view.setUrl(QUrl(config.WHATSAPP_URL))
             except Exception as e:
                 QMessageBox.critical(
                     self,
@@ -157,6 +304,8 @@ class WhatsAppTab(QWidget):
     def reload_whatsapp(self):
         if self.web_view:
             self.web_view.reload()
+        elif self.is_hibernated:
+            self.reload_requested.emit()
     
     def zoom_in(self):
         if self.web_view:
@@ -299,11 +448,20 @@ class WhatsAppTab(QWidget):
             QLineEdit.EchoMode.Password
         )
         
+        if not ok or self.verifying:
+            return
+        if self.passwords:
+            self.verifying = True
+            self.passwords.verify(self.account_id, password, self.on_password_verified)
+        else:
+            self.on_password_verified(self.db is not None and self.db.verify_password(self.account_id, password))
+    
+    def on_password_verified(self, ok):
+        self.verifying = False
         if ok:
-            if self.db and self.db.verify_password(self.account_id, password):
-                self.unlock_tab()
-            else:
-                QMessageBox.warning(self, "Wrong Password", "The password you entered is incorrect.")
+            self.unlock_tab()
+        else:
+            QMessageBox.warning(self, "Wrong Password", "The password you entered is incorrect.")
     
     def lock_tab(self):
         self.is_locked = True
@@ -332,18 +490,16 @@ class WhatsAppTab(QWidget):
         if self.web_view:
             self.web_view.show()
         else:
-            self.create_webview()
+            self.activate()
             
             if self.web_view:
-                self.layout().addWidget(self.web_view)
                 self.web_view.show()
-                self.apply_zoom()
-                QTimer.singleShot(100, self.load_whatsapp)
             else:
                 QMessageBox.critical(self, "Error", f"Failed to load WhatsApp Web for {self.name}.\nPlease try again.")
                 self.lock_tab()
     
-    def cleanup(self):
+    def cleanup(self, release_profile=True):
+        """Tear down the web view; keep the profile for reuse unless release_profile"""
         if self.web_view:
             self.web_view.setUrl(QUrl("about:blank"))
             self.web_view.stop()
@@ -359,7 +515,11 @@ class WhatsAppTab(QWidget):
             self.web_view.deleteLater()
             self.web_view = None
         
-        if self.profile:
-            profile_to_delete = self.profile
-            self.profile = None
-            QTimer.singleShot(1000, lambda: profile_to_delete.deleteLater())
+        self.page_ready = False
+        self.lifecycle_state = "active"
+        self.profile = None
+        # A profile can only exist once the factory (and with it QtWebEngine)
+        # has been imported; a never-built lazy tab must not import it now
+        profile_factory = sys.modules.get("gui.profile_factory")
+        if release_profile and profile_factory is not None:
+            profile_factory.profiles.release(self.account_id)
@@ -1,9 +1,16 @@
+from core.startup_timeline import timeline
 import sys
 import os
 from PyQt6.QtWidgets import QApplication
+from PyQt6.QtCore import Qt, QCoreApplication
+from core import config
+from core.memory import renderer_limits
 from gui.main_window import MainWindow
 
-def main():
+def set_chromium_flags():
+    # Renderer count and JS heap follow the host's memory budget
+    process_limit, heap_mb = renderer_limits(config.MEMORY_BUDGET_MB)
+    
     # Set Chromium flags for stability AND balanced memory optimization
     os.environ["QTWEBENGINE_CHROMIUM_FLAGS"] = (
         "--disable-gpu-process-crash-limit "
@@ -19,9 +26,9 @@ def main():
         "--no-first-run "
         "--no-default-browser-check "
         "--disable-sync "
-        # Limit processes and memory (increased for multiple accounts)
-        "--renderer-process-limit=15 "
-        "--js-flags=--max-old-space-size=768 "
+        # Limit processes and memory (scaled to available RAM)
+        f"--renderer-process-limit={process_limit} "
+        f"--js-flags=--max-old-space-size={heap_mb} "
         # Prevent shared worker crashes
         "--disable-shared-workers "
         # Enable process-per-site for better isolation
@@ -35,19 +42,34 @@ def main():
         "--disable-prompt-on-repost "
         # Canvas and WebGL stability for QR codes
         "--enable-webgl "
-        "--enable-accelerated-2d-canvas "
-        # Process crash recovery
-        "--disable-renderer-backgrounding "
-        "--disable-background-timer-throttling "
-        "--disable-backgrounding-occluded-windows"
+        "--enable-accelerated-2d-canvas"
+        # Renderer backgrounding and timer throttling stay on: hidden tabs are
+        # throttled by Chromium and frozen by the lifecycle controller
     )
+
+def create_application(argv):
+    """QApplication with the Chromium flags and Qt attributes WebEngine needs.
+    
+    WebEngine is imported lazily, after QApplication exists, so anything that
+    builds tabs (the app and the benchmarks) must create its QApplication here.
+    """
+    set_chromium_flags()
     
-    app = QApplication(sys.argv)
+    # Required by QtWebEngine when it is imported after QApplication exists
+    QCoreApplication.setAttribute(Qt.ApplicationAttribute.AA_ShareOpenGLContexts)
+    
+    return QApplication(argv)
+
+def main():
+    timeline.mark("imports")
+    app = create_application(sys.argv)
     app.setApplicationName("WhatsApp Manager")
     app.setStyle("Fusion")
+    timeline.mark("qt_app")
     
     window = MainWindow()
     window.show()
+    timeline.mark("window_shown")
     
     sys.exit(app.exec())
 
@@ -0,0 +1,5 @@
+// WhatsApp Web refuses to run when navigator.webdriver is set; hide it
+// before any page script can read it.
+Object.defineProperty(navigator, 'webdriver', {
+    get: () => undefined
+});